@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+resolve_common.py
+
+Helpers shared by resolve_studio_apply_edits.py and
+resolve_studio_apply_edits_console.py: timecode parsing, intensity colors and
+sorted clip lookups. Nothing here talks to Resolve except through the clip and
+timeline objects passed in.
+"""
+
+import bisect
+import functools
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+FPS = 30
+
+# Indexed by edit intensity 1-5 (normalize_edits clamps to that range);
+# slot 0 holds the default color used for edits without an intensity
+INTENSITY_COLOR = ("Blue", "Green", "Cyan", "Yellow", "Orange", "Red")
+
+# [[HH:]MM:]SS[.fff] - minutes are filled before hours so "05:22" is MM:SS
+_TC_RE = re.compile(r"(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d+)?)")
+
+# Digit positions in "HH:MM:SS"
+_HMS_DIGIT_POS = (0, 1, 3, 4, 6, 7)
+
+# ============================================================================
+# TIMECODES
+# ============================================================================
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timecode_str(tc: str) -> float:
+    # Fast path for the common zero-padded HH:MM:SS shape: no regex, no allocations
+    if (len(tc) == 8 and tc[2] == ":" and tc[5] == ":"
+            and all("0" <= tc[i] <= "9" for i in _HMS_DIGIT_POS)):
+        return (((ord(tc[0]) - 48) * 10 + ord(tc[1]) - 48) * 3600
+                + ((ord(tc[3]) - 48) * 10 + ord(tc[4]) - 48) * 60
+                + (ord(tc[6]) - 48) * 10 + ord(tc[7]) - 48)
+    m = _TC_RE.fullmatch(tc.strip())
+    if not m:
+        return 0
+    h, mn, s = m.groups()
+    return int(h or 0) * 3600 + int(mn or 0) * 60 + float(s)
+
+def parse_timecode_to_seconds(tc: str) -> float:
+    """Convert HH:MM:SS or MM:SS or seconds to float seconds."""
+    if not tc or tc == "":
+        return 0
+    if isinstance(tc, (int, float)):
+        return float(tc)
+    # Guides repeat the same boundaries often, so string parses are memoized
+    return _parse_timecode_str(tc)
+
+@functools.lru_cache(maxsize=4096)
+def seconds_to_frames(seconds: float, fps: int = FPS) -> int:
+    """Convert seconds to frame count at given fps."""
+    return int(round(float(seconds) * int(fps)))
+
+# ============================================================================
+# CLIP LOOKUPS
+# ============================================================================
+
+def sort_clip_bounds(clips: List[Any], warn: Optional[Callable[[str], None]] = None) -> Tuple[List[int], List[int], List[Any]]:
+    """Read each clip's start/end once (two Resolve calls per clip) and return
+    parallel starts/ends/clips lists sorted by start. Clips that fail are skipped."""
+    bounds = []
+    add = bounds.append
+    for clip in clips:
+        try:
+            add((clip.GetStart(), clip.GetEnd(), clip))
+        except Exception as e:
+            if warn:
+                warn(f"Error checking clip: {e}")
+    bounds.sort(key=lambda b: b[0])
+    return [b[0] for b in bounds], [b[1] for b in bounds], [b[2] for b in bounds]
+
+def snapshot_clips(timeline: Any, warn: Optional[Callable[[str], None]] = None) -> List[Tuple[List[int], List[int], List[Any]]]:
+    """index_tracks() over every video track of timeline, in one sweep."""
+    tracks: List[List[Any]] = []
+    if not timeline:
+        return []
+    try:
+        track_count = timeline.GetTrackCount("video")
+        items_in_track = timeline.GetItemListInTrack
+        for track_idx in range(1, track_count + 1):
+            tracks.append(list(items_in_track("video", track_idx) or []))
+    except Exception as e:
+        if warn:
+            warn(f"Failed to get clips: {e}")
+    return index_tracks(tracks, warn)
+
+def clip_at_frame(starts: List[int], ends: List[int], clips: List[Any], frame: int) -> Optional[Any]:
+    """Clip whose [start, end) contains frame, or None."""
+    i = bisect.bisect_right(starts, frame) - 1
+    if i < 0 or frame >= ends[i]:
+        return None
+    return clips[i]
+
+def index_tracks(tracks: List[List[Any]], warn: Optional[Callable[[str], None]] = None) -> List[Tuple[List[int], List[int], List[Any]]]:
+    """sort_clip_bounds() for each track's clips, kept in track order.
+
+    Clips on different tracks overlap, so each track gets its own index rather
+    than one merged list."""
+    return [sort_clip_bounds(track_clips, warn) for track_clips in tracks]
+
+def clip_at_frame_in_tracks(tracks: List[Tuple[List[int], List[int], List[Any]]], frame: int) -> Optional[Any]:
+    """Clip containing frame on the first track (in track order) that has one, or None."""
+    for starts, ends, clips in tracks:
+        clip = clip_at_frame(starts, ends, clips, frame)
+        if clip is not None:
+            return clip
+    return None
+
+def match_edits_to_clips(edits: List[Dict[str, Any]], tracks: List[Tuple[List[int], List[int], List[Any]]]) -> List[Optional[Any]]:
+    """For each edit, the clip containing its start_f (first track wins), or None."""
+    return [clip_at_frame_in_tracks(tracks, edit["start_f"]) for edit in edits]
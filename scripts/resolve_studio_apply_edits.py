@@ -7,10 +7,11 @@ This script applies editing guide JSON directly to clips with complete property
 
 Usage:
     python3 resolve_studio_apply_edits.py --json /path/to/editing_guide.json \
-        [--project-name "Project Name"] [--dry-run]
+        [--project-name "Project Name"] [--dry-run] [--parallel]
 
 Environment:
     EDITING_GUIDE_JSON=/path/to/guide.json python3 resolve_studio_apply_edits.py
+    RS_DEBUG=1 enables verbose [DEBUG] output
 
 Features:
     - 100% automated clip property modification
@@ -26,21 +27,66 @@ import json
 import os
 import sys
 import argparse
+import bisect
 import platform
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+# Shared helpers (timecodes, colors, clip lookups) live next to this script
+_SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
+from resolve_common import (
+    FPS,
+    INTENSITY_COLOR,
+    clip_at_frame_in_tracks,
+    index_tracks,
+    parse_timecode_to_seconds,
+    seconds_to_frames,
+)
+
+# Optional fast JSON parser/encoder for guides and logs; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional streaming parser: edits are read one at a time instead of loading the whole guide
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # ============================================================================
 # DAVINCI RESOLVE API AUTO-DISCOVERY
 # ============================================================================
 
+# Remembers the Modules directory that worked last time so later runs skip discovery
+RESOLVE_PATH_CACHE = Path.home() / ".cache" / "resolve_script_path"
+
+def _read_cached_script_path() -> Optional[str]:
+    try:
+        cached = RESOLVE_PATH_CACHE.read_text().strip()
+    except OSError:
+        return None
+    return cached or None
+
+def _write_cached_script_path(path: str) -> None:
+    try:
+        RESOLVE_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        RESOLVE_PATH_CACHE.write_text(path)
+    except OSError:
+        pass
+
 def GetResolve():
     """
     Return a Resolve scripting app instance, or None if unavailable.
     - Tries normal import first.
-    - Falls back to macOS default Modules path via sys.path
+    - Falls back to env overrides, then the cached Modules path from a
+      previous run, then the macOS default Modules path via sys.path
     - As a last resort, tries the official python_get_resolve.py helper.
     
     Based on Blackmagic's python_get_resolve.py pattern.
@@ -56,6 +102,7 @@ def GetResolve():
 
     if bmd is None:
         searched = []
+        cached_path = _read_cached_script_path()
 
         # Common environment variable overrides (aligns with helper patterns)
         env_candidates = [
@@ -65,10 +112,15 @@ def GetResolve():
         ]
         candidates = [p for p in env_candidates if p]
 
+        # Path that worked on a previous run comes before the defaults, never
+        # before an override the user set
+        if cached_path and cached_path not in candidates:
+            candidates.append(cached_path)
+
         # macOS default (primary target)
         if platform.system() == "Darwin":
             base = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting"
-            candidates += [os.path.join(base, "Modules"), base]
+            candidates += [p for p in (os.path.join(base, "Modules"), base) if p not in candidates]
 
         # Attempt to load the module via sys.path (REQUIRED for DaVinciResolveScript)
         # The DaVinciResolveScript.py module replaces itself with fusionscript,
@@ -85,6 +137,8 @@ def GetResolve():
                 try:
                     import DaVinciResolveScript as bmd  # type: ignore
                     if bmd and hasattr(bmd, 'scriptapp'):
+                        if path != cached_path:
+                            _write_cached_script_path(path)
                         break
                 except ImportError:
                     bmd = None
@@ -145,18 +199,12 @@ if not RESOLVE_API_AVAILABLE:
 # CONSTANTS & CONFIGURATION
 # ============================================================================
 
-FPS = 30
+# Verbose [DEBUG] output; printing Resolve objects can itself cost API round-trips
+DEBUG = bool(os.getenv("RS_DEBUG"))
+PROGRESS_FLUSH_EVERY = 50
 DEFAULT_COLOR_PRESET = "PunchyContrast"
 DEFAULT_VIGNETTE_PRESET = "VignetteMedium"
 
-INTENSITY_COLOR = {
-    1: "Green",
-    2: "Cyan",
-    3: "Yellow",
-    4: "Orange",
-    5: "Red",
-}
-
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
@@ -164,44 +212,11 @@ INTENSITY_COLOR = {
 def current_timestamp():
     return datetime.now().isoformat()
 
-def parse_timecode_to_seconds(tc: str) -> float:
-    """Convert HH:MM:SS or MM:SS or seconds to float seconds."""
-    if not tc or tc == "":
-        return 0
-    
-    try:
-        # Try as pure number
-        return float(tc)
-    except ValueError:
-        pass
-    
-    # Parse HH:MM:SS format
-    parts = tc.split(":")
-    try:
-        if len(parts) == 3:
-            h, m, s = [int(p) for p in parts]
-            return h * 3600 + m * 60 + s
-        elif len(parts) == 2:
-            m, s = [int(p) for p in parts]
-            return m * 60 + s
-        elif len(parts) == 1:
-            return int(float(parts[0]))
-    except (ValueError, IndexError):
-        pass
-    
-    return 0
-
-def seconds_to_frames(seconds: float, fps: int = FPS) -> int:
-    """Convert seconds to frame count at given fps."""
-    return int(round(float(seconds) * int(fps)))
-
 def frames_to_timecode(frames: int, fps: int = FPS) -> str:
     """Convert frames to HH:MM:SS:FF timecode."""
-    total_seconds = int(frames / fps)
-    frame_in_sec = frames % fps
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
+    total_seconds, frame_in_sec = divmod(int(frames), int(fps))
+    minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{frame_in_sec:02d}"
 
 def print_section(title: str):
@@ -209,6 +224,16 @@ def print_section(title: str):
     print(f"  {title}")
     print(f"{'=' * 80}")
 
+def _compute_offsets(starts: List[int], ends: List[int], totals: List[int]) -> List[Tuple[int, int, int]]:
+    """Left offset, segment length and right offset for each full-clip append."""
+    out = []
+    for start_f, end_f, total in zip(starts, ends, totals):
+        l_off = max(0, start_f)
+        length = max(1, end_f - start_f)
+        out.append((l_off, length, max(0, total - l_off - length)))
+    return out
+
+
 # ============================================================================
 # RESOLVE STUDIO API WRAPPER
 # ============================================================================
@@ -217,11 +242,24 @@ class ResolveStudioWrapper:
     """Wrapper around Resolve Studio Python API with error handling."""
     
     def __init__(self):
-        self.resolve = dvr.scriptapp("Resolve")
+        # Reuse the app created at import time instead of a second handshake
+        self.resolve = RESOLVE or dvr.scriptapp("Resolve")
         self.pm = self.resolve.GetProjectManager()
         self.current_project = None
         self.current_timeline = None
         self.warnings = []
+        # Lazily built by _get_timelines_by_name(); reset when the project changes
+        self._timeline_by_name: Optional[Dict[str, Any]] = None
+        # (timeline, count) cached by video_track_count()
+        self._track_count: Optional[Tuple[Any, int]] = None
+        # None until the first AddTrack call shows which signature this build accepts
+        self._add_track_with_index: Optional[bool] = None
+        # Absolute path -> media pool items for the current project
+        self._pooled_paths: Optional[Dict[str, List[Any]]] = None
+        # media path -> Path.exists() result
+        self._exists_cache: Dict[str, bool] = {}
+        # clipInfo dicts waiting for the next flush_segments() call
+        self._pending_clip_infos: List[Dict[str, Any]] = []
     
     def get_project_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
         try:
@@ -236,32 +274,47 @@ class ResolveStudioWrapper:
             return False
     
     # Timeline helpers
+    def video_track_count(self) -> int:
+        """Video track count of the current timeline, cached until the timeline
+        changes or ensure_video_track() adds tracks."""
+        tl = self.current_timeline
+        if self._track_count is None or self._track_count[0] is not tl:
+            try:
+                count = int(tl.GetTrackCount("video") or 0) if tl else 0
+            except Exception:
+                count = 0
+            self._track_count = (tl, count)
+        return self._track_count[1]
+    
+    def _add_video_track(self, tl: Any, new_index: int) -> None:
+        """AddTrack("video"), or AddTrack("video", index) on builds that need it.
+        The working signature is probed once and remembered."""
+        if self._add_track_with_index is None:
+            try:
+                tl.AddTrack("video")
+                self._add_track_with_index = False
+                return
+            except Exception:
+                self._add_track_with_index = True
+        if self._add_track_with_index:
+            tl.AddTrack("video", new_index)
+        else:
+            tl.AddTrack("video")
+    
     def ensure_video_track(self, index: int) -> bool:
         try:
             tl = self.current_timeline
             if not tl:
                 return False
-            count = int(tl.GetTrackCount("video") or 0)
-            attempts = 0
-            while count < index and attempts < 5:
-                attempts += 1
-                added = False
-                try:
-                    res = tl.AddTrack("video")
-                    added = True
-                except Exception:
-                    pass
-                if not added:
-                    try:
-                        tl.AddTrack("video", int(count + 1))
-                        added = True
-                    except Exception:
-                        pass
-                count = int(tl.GetTrackCount("video") or 0)
-                if not added and count < index:
-                    break
-            return count >= index
+            count = self.video_track_count()
+            if count >= index:
+                return True
+            self._track_count = None
+            for new_index in range(count + 1, index + 1):
+                self._add_video_track(tl, new_index)
+            return self.video_track_count() >= index
         except Exception:
+            self._track_count = None
             return False
     
     def lock_track(self, index: int, lock: bool = True) -> None:
@@ -286,57 +339,115 @@ class ResolveStudioWrapper:
         except Exception:
             return False
     
-    def append_segment(self, media_item: Any, start_f: int, end_f: int, video_track_index: int, record_f: Optional[int] = None, include_audio: bool = True) -> Optional[Any]:
-        """Append a media segment [start_f,end_f) to a specific video track at record_f.
-        Returns the new timeline item. If record_f is None, appends at timeline end.
+    def queue_segment(self, media_item: Any, start_f: int, end_f: int, video_track_index: int, record_f: Optional[int] = None, include_audio: bool = True) -> None:
+        """Queue a media segment [start_f,end_f) for video_track_index at record_f.
+        Nothing is sent to Resolve until flush_segments(). If record_f is None, the
+        segment follows the previously queued one (or the timeline end if none).
         """
-        try:
-            mp = self.current_project.GetMediaPool()
-            tl = self.current_timeline
-            rec = int(record_f) if record_f is not None else 0
-            if record_f is None:
+        if record_f is None:
+            if self._pending_clip_infos:
+                prev = self._pending_clip_infos[-1]
+                rec = prev["recordFrame"] + (prev["endFrame"] - prev["startFrame"])
+            else:
                 try:
-                    rec = int(tl.GetEndFrame() or 0) + 1
+                    rec = int(self.current_project.GetCurrentTimeline().GetEndFrame() or 0) + 1
                 except Exception:
                     rec = 0
-            # Build clipInfo
-            clip_info = {
-                "mediaPoolItem": media_item,
-                "startFrame": int(start_f),
-                "endFrame": int(end_f),
-                "trackIndex": int(video_track_index),
-                "recordFrame": int(rec),
-            }
-            # Only force video-only when include_audio is False
-            if not include_audio:
-                clip_info["mediaType"] = 1
-            # Structured append
+        else:
+            rec = record_f
+        # Build clipInfo
+        clip_info = {
+            "mediaPoolItem": media_item,
+            "startFrame": start_f,
+            "endFrame": end_f,
+            "trackIndex": video_track_index,
+            "recordFrame": rec,
+        }
+        # Only force video-only when include_audio is False
+        if not include_audio:
+            clip_info["mediaType"] = 1
+        self._pending_clip_infos.append(clip_info)
+    
+    def flush_segments(self) -> List[Optional[Any]]:
+        """Append every queued segment to the project's current timeline with a
+        single AppendToTimeline call. Returns the new timeline items in queue
+        order (None for any segment that could not be placed).
+        """
+        pending = self._pending_clip_infos
+        self._pending_clip_infos = []
+        if not pending:
+            return []
+        try:
+            mp = self.current_project.GetMediaPool()
+            tl = self.current_project.GetCurrentTimeline()
+        except Exception:
+            return [None] * len(pending)
+        
+        # Structured append for the whole batch
+        res = None
+        try:
+            res = mp.AppendToTimeline(pending)
+        except Exception:
             res = None
+        
+        if not res:
+            # Fallback: append each full clip, then trim them all in one pass
+            segs: List[Optional[Any]] = []
+            totals: List[int] = []
+            for info in pending:
+                seg = None
+                total = 0
+                try:
+                    mp.AppendToTimeline([info["mediaPoolItem"]])
+                    items = tl.GetItemListInTrack("video", info["trackIndex"]) or []
+                    seg = items[-1] if items else None
+                    if seg is not None:
+                        total = int(seg.GetDuration() or 0)
+                except Exception:
+                    pass
+                segs.append(seg)
+                totals.append(total)
+            offsets = _compute_offsets(
+                [info["startFrame"] for info in pending],
+                [info["endFrame"] for info in pending],
+                totals,
+            )
+            for seg, (l_off, _, r_off) in zip(segs, offsets):
+                if seg is None:
+                    continue
+                try:
+                    seg.SetLeftOffset(l_off)
+                    seg.SetRightOffset(r_off)
+                except Exception:
+                    pass
+            return segs
+        
+        # AppendToTimeline returns the new items in clipInfo order
+        if isinstance(res, (list, tuple)) and len(res) == len(pending):
+            return list(res)
+        
+        # Otherwise read each touched track once and match items back by record frame
+        by_position: Dict[Tuple[int, int], Any] = {}
+        for track in sorted({info["trackIndex"] for info in pending}):
             try:
-                res = mp.AppendToTimeline([clip_info])
-            except Exception:
-                res = None
-            # Fallback: append full, then trim
-            if not res:
-                mp.AppendToTimeline([media_item])
-            # Identify last item on target track
-            items = self.get_items_in_track(video_track_index)
-            seg = items[-1] if items else None
-            if seg is None:
-                return None
-            # If structured append failed, trim manually
-            try:
-                total = int(seg.GetDuration() or 0)
-                l_off = max(0, int(start_f))
-                S = max(1, int(end_f - start_f))
-                r_off = max(0, total - l_off - S)
-                seg.SetLeftOffset(l_off)
-                seg.SetRightOffset(r_off)
+                items = tl.GetItemListInTrack("video", track) or []
             except Exception:
-                pass
-            return seg
-        except Exception:
-            return None
+                items = []
+            for item in items:
+                try:
+                    by_position[(track, int(item.GetStart()))] = item
+                except Exception:
+                    continue
+        return [by_position.get((info["trackIndex"], info["recordFrame"])) for info in pending]
+    
+    def append_segment(self, media_item: Any, start_f: int, end_f: int, video_track_index: int, record_f: Optional[int] = None, include_audio: bool = True) -> Optional[Any]:
+        """Append a media segment [start_f,end_f) to a specific video track at record_f.
+        Returns the new timeline item. If record_f is None, appends at timeline end.
+        Prefer queue_segment()/flush_segments() when appending many segments.
+        """
+        self.queue_segment(media_item, start_f, end_f, video_track_index, record_f=record_f, include_audio=include_audio)
+        segs = self.flush_segments()
+        return segs[-1] if segs else None
     
     def load_or_create_project(self, project_name: str) -> bool:
         """Load or create a project."""
@@ -345,6 +456,8 @@ class ResolveStudioWrapper:
             proj = self.pm.LoadProject(project_name)
             if proj:
                 self.current_project = proj
+                self._timeline_by_name = None
+                self._pooled_paths = None
                 print(f"[✓] Loaded project: {project_name}")
                 return True
         except Exception as e:
@@ -355,12 +468,29 @@ class ResolveStudioWrapper:
             proj = self.pm.CreateProject(project_name)
             if proj:
                 self.current_project = proj
+                self._timeline_by_name = None
+                self._pooled_paths = None
                 print(f"[✓] Created project: {project_name}")
                 return True
         except Exception as e:
             print(f"[ERROR] Could not create project: {e}")
             return False
     
+    def _get_timelines_by_name(self) -> Dict[str, Any]:
+        """Map timeline name -> timeline for the current project, built on first use."""
+        if self._timeline_by_name is None:
+            by_name: Dict[str, Any] = {}
+            count = int(self.current_project.GetTimelineCount() or 0)
+            for i in range(1, count + 1):
+                tl_i = self.current_project.GetTimelineByIndex(i)
+                try:
+                    if tl_i:
+                        by_name.setdefault(tl_i.GetName(), tl_i)
+                except Exception:
+                    continue
+            self._timeline_by_name = by_name
+        return self._timeline_by_name
+    
     def ensure_timeline(self, timeline_name: str = "Editing Guide", fps: int = FPS) -> bool:
         """Ensure a timeline exists at desired FPS.
         - Reuse existing matching timeline if present
@@ -369,8 +499,8 @@ class ResolveStudioWrapper:
         try:
             # Force project settings before creating the timeline
             self.set_project_setting("useCustomTimelineSettings", "1")
-            self.set_project_setting("timelineFrameRate", str(int(fps)))
-            self.set_project_setting("timelinePlaybackFrameRate", str(int(fps)))
+            self.set_project_setting("timelineFrameRate", str(fps))
+            self.set_project_setting("timelinePlaybackFrameRate", str(fps))
         except Exception as e:
             print(f"[WARN] Could not set project FPS settings: {e}")
         
@@ -385,25 +515,20 @@ class ResolveStudioWrapper:
             pass
         
         try:
-            count = self.current_project.GetTimelineCount()
-            target_name = f"{timeline_name} ({int(fps)}fps)"
-            for i in range(1, int(count or 0) + 1):
-                tl_i = self.current_project.GetTimelineByIndex(i)
-                try:
-                    if tl_i and tl_i.GetName() == target_name:
-                        self.current_project.SetCurrentTimeline(tl_i)
-                        self.current_timeline = tl_i
-                        print(f"[✓] Using timeline: {target_name}")
-                        return True
-                except Exception:
-                    continue
+            target_name = f"{timeline_name} ({fps}fps)"
+            tl_i = self._get_timelines_by_name().get(target_name)
+            if tl_i:
+                self.current_project.SetCurrentTimeline(tl_i)
+                self.current_timeline = tl_i
+                print(f"[✓] Using timeline: {target_name}")
+                return True
         except Exception:
             pass
         
         # Create a fresh timeline with an FPS suffix; ensure unique name
         try:
             mp = self.current_project.GetMediaPool()
-            base_name = f"{timeline_name} ({int(fps)}fps)"
+            base_name = f"{timeline_name} ({fps}fps)"
             tl_name = base_name
             attempt = 1
             tl = mp.CreateEmptyTimeline(tl_name)
@@ -412,6 +537,8 @@ class ResolveStudioWrapper:
                 tl = mp.CreateEmptyTimeline(tl_name)
                 attempt += 1
             if tl:
+                if self._timeline_by_name is not None:
+                    self._timeline_by_name[tl_name] = tl
                 self.current_project.SetCurrentTimeline(tl)
                 self.current_timeline = tl
                 print(f"[✓] Created timeline: {tl_name}")
@@ -423,17 +550,48 @@ class ResolveStudioWrapper:
             print(f"[ERROR] Could not create timeline: {e}")
             return False
     
+    def _get_pooled_paths(self) -> Dict[str, List[Any]]:
+        """Map absolute file path -> media pool items already in the root bin,
+        scanned once per project."""
+        if self._pooled_paths is None:
+            self._pooled_paths = {}
+            try:
+                clips = self.current_project.GetMediaPool().GetRootFolder().GetClipList() or []
+            except Exception:
+                clips = []
+            for clip in clips:
+                try:
+                    fp = clip.GetClipProperty("File Path")
+                except Exception:
+                    fp = None
+                if fp:
+                    self._pooled_paths.setdefault(str(Path(fp).resolve()), []).append(clip)
+        return self._pooled_paths
+    
     def import_media(self, media_path: str) -> bool:
-        """Import media file to project and append only if timeline is empty."""
-        if not Path(media_path).exists():
+        """Import media file to project and append only if timeline is empty.
+        Media already in the pool is reused instead of imported again."""
+        exists = self._exists_cache.get(media_path)
+        if exists is None:
+            # Media files are not expected to appear or vanish mid-run
+            exists = self._exists_cache[media_path] = Path(media_path).exists()
+        if not exists:
             print(f"[WARN] Media file not found: {media_path}")
             return False
         
         try:
             mp = self.current_project.GetMediaPool()
-            items = mp.ImportMedia([media_path])
+            pooled = self._get_pooled_paths()
+            ap = str(Path(media_path).resolve())
+            items = pooled.get(ap)
+            if items:
+                print(f"[INFO] Media already in pool: {media_path}")
+            else:
+                items = mp.ImportMedia([media_path])
+                if items:
+                    pooled[ap] = list(items)
+                    print(f"[✓] Imported {len(items)} clip(s)")
             if items:
-                print(f"[✓] Imported {len(items)} clip(s)")
                 # Append to timeline only if there are no existing video items
                 try:
                     tl = self.current_timeline or self.current_project.GetCurrentTimeline()
@@ -471,38 +629,75 @@ class ClipModifier:
     def __init__(self, resolve_wrapper: ResolveStudioWrapper):
         self.resolve = resolve_wrapper
         self.modifications = []
+        # Per-track clip indices in track order, plus every clip sorted by
+        # start for find_nearest_clip(); see _build_clip_index()
+        self._track_index: List[Tuple[List[int], List[int], List[Any]]] = []
+        self._sorted_starts: List[int] = []
+        self._sorted_clips: List[Any] = []
     
     def get_timeline_clips(self) -> List[Any]:
         """Get all clips in timeline."""
-        clips = []
+        return [clip for track in self.get_timeline_tracks() for clip in track]
+    
+    def get_timeline_tracks(self) -> List[List[Any]]:
+        """Get the clips of each video track, in track order."""
+        tracks = []
         try:
-            print(f"[DEBUG] Timeline in get_timeline_clips: {self.resolve.current_timeline}")
-            # Try to get video track count - may return None if no tracks or API unavailable
-            track_count = self.resolve.current_timeline.GetTrackCount("video")
-            print(f"[DEBUG] Track count: {track_count}")
+            tl = self.resolve.current_timeline
+            if DEBUG:
+                print(f"[DEBUG] Timeline in get_timeline_clips: {tl}")
+            # Track count may be 0 if no tracks or API unavailable
+            track_count = self.resolve.video_track_count()
+            if DEBUG:
+                print(f"[DEBUG] Track count: {track_count}")
             
-            if track_count and track_count > 0:
-                for track_idx in range(1, int(track_count) + 1):
-                    # Get items in track
-                    items = self.resolve.current_timeline.GetItemListInTrack("video", track_idx)
-                    print(f"[DEBUG] Track {track_idx} items: {items}")
-                    if items:
-                        clips.extend(items)
+            if track_count > 0:
+                tracks = [list(tl.GetItemListInTrack("video", i) or ()) for i in range(1, track_count + 1)]
             else:
                 # Fallback: try to get all clips directly from timeline
-                print("[DEBUG] No track count available, trying direct timeline clip access")
+                if DEBUG:
+                    print("[DEBUG] No track count available, trying direct timeline clip access")
                 try:
                     # Some Resolve API versions have different methods
-                    all_clips = self.resolve.current_timeline.GetClips()
+                    all_clips = tl.GetClips()
                     if all_clips:
-                        clips.extend(all_clips)
-                        print(f"[DEBUG] Retrieved {len(all_clips)} clips directly")
+                        tracks.append(list(all_clips))
+                        if DEBUG:
+                            print(f"[DEBUG] Retrieved {len(all_clips)} clips directly")
                 except Exception as fallback_err:
-                    print(f"[DEBUG] Direct clip access failed: {fallback_err}")
+                    if DEBUG:
+                        print(f"[DEBUG] Direct clip access failed: {fallback_err}")
         except Exception as e:
             print(f"[WARN] Could not get clips: {e}")
         
-        return clips
+        return tracks
+    
+    def _build_clip_index(self, tracks: Optional[List[List[Any]]] = None) -> None:
+        """Read clip bounds once (two Resolve calls per clip) and index them per
+        track for the find_* lookups. Uses get_timeline_tracks() if tracks is None."""
+        if tracks is None:
+            tracks = self.get_timeline_tracks()
+        self._track_index = index_tracks(tracks)
+        merged = sorted(
+            ((start, clip) for starts, _, clips in self._track_index for start, clip in zip(starts, clips)),
+            key=lambda b: b[0],
+        )
+        self._sorted_starts = [b[0] for b in merged]
+        self._sorted_clips = [b[1] for b in merged]
+    
+    def find_clip_at_frame(self, frame: int) -> Optional[Any]:
+        """Clip whose [start, end) contains frame, checking tracks in order, or None."""
+        return clip_at_frame_in_tracks(self._track_index, frame)
+    
+    def find_nearest_clip(self, frame: int, tolerance_f: int) -> Optional[Any]:
+        """Clip starting closest to frame, if within tolerance_f frames."""
+        starts = self._sorted_starts
+        # Only the clips starting just before and after frame can be nearest
+        i = bisect.bisect_left(starts, frame)
+        near = [j for j in (i, i - 1) if 0 <= j < len(starts) and abs(starts[j] - frame) < tolerance_f]
+        if not near:
+            return None
+        return self._sorted_clips[min(near, key=lambda j: abs(starts[j] - frame))]
     
     def set_clip_speed(self, clip: Any, speed_factor: float) -> bool:
         """Set clip playback speed (0.5 = 50%, 1.0 = normal, 2.0 = 200%)."""
@@ -532,6 +727,31 @@ class ClipModifier:
             print(f"[WARN] Could not set opacity: {e}")
             return False
     
+    def _find_media_io(self, fusion: Any) -> Tuple[Optional[Any], Optional[Any]]:
+        """Return (MediaIn, MediaOut) tools of a Fusion comp."""
+        tools = {}
+        try:
+            tools = fusion.GetToolList(True)  # include names
+        except Exception:
+            tools = fusion.GetToolList() or {}
+        media_in = None
+        media_out = None
+        for t in (tools.values() if isinstance(tools, dict) else []):
+            try:
+                reg_id = getattr(t, "ID", "")
+                if reg_id not in ("MediaIn", "MediaOut"):
+                    # Only ask Resolve for attrs when the ID attribute is missing/unknown
+                    reg_id = getattr(t, "GetAttrs", lambda: {})().get("TOOLS_RegID")
+                if reg_id == "MediaIn":
+                    media_in = t
+                elif reg_id == "MediaOut":
+                    media_out = t
+            except Exception:
+                continue
+            if media_in is not None and media_out is not None:
+                break
+        return media_in, media_out
+    
     def set_clip_zoom(self, clip: Any, start_zoom: float, end_zoom: float) -> bool:
         """Apply zoom. Prefer Inspector (static), fallback to Fusion ramp if start!=end.
         Returns True if any zoom adjustment was applied.
@@ -554,6 +774,10 @@ class ClipModifier:
             pass
 
         # 2) Fallback: Create Fusion Transform and attempt a simple ramp
+        return self._fusion_zoom(clip, start_zoom, end_zoom)
+    
+    def _fusion_zoom(self, clip: Any, start_zoom: float, end_zoom: float) -> bool:
+        """Insert an AutoZoomTransform between MediaIn/MediaOut and keyframe Size."""
         try:
             fusion = clip.GetFusionCompByIndex(1)
             if not fusion:
@@ -562,21 +786,7 @@ class ClipModifier:
                 raise RuntimeError("Fusion comp unavailable")
 
             # Locate MediaIn/MediaOut
-            tools = {}
-            try:
-                tools = fusion.GetToolList(True)  # include names
-            except Exception:
-                tools = fusion.GetToolList() or {}
-            media_in = None
-            media_out = None
-            for t in (tools.values() if isinstance(tools, dict) else []):
-                try:
-                    if getattr(t, "ID", "") == "MediaIn" or getattr(t, "GetAttrs", lambda: {})().get("TOOLS_RegID") == "MediaIn":
-                        media_in = t
-                    if getattr(t, "ID", "") == "MediaOut" or getattr(t, "GetAttrs", lambda: {})().get("TOOLS_RegID") == "MediaOut":
-                        media_out = t
-                except Exception:
-                    continue
+            media_in, media_out = self._find_media_io(fusion)
 
             # Create a Transform tool explicitly and connect between MediaIn and MediaOut
             transform = fusion.AddTool("Transform", -32768, -32768)
@@ -620,6 +830,89 @@ class ClipModifier:
             print(f"[WARN] Could not set zoom: {e}")
             return False
     
+    def apply_clip_mods(self, clip: Any, spec: Dict[str, Any]) -> Dict[str, bool]:
+        """Apply several modifications to one clip in a single pass.
+        spec keys (all optional): "speed" (factor), "opacity" (0.0-1.0),
+        "zoom" ((start, end)), "trim" ((left_offset, right_offset)).
+        Returns {key: applied} for every key present in spec.
+        """
+        applied: Dict[str, bool] = {}
+        try:
+            clip_name = clip.GetName()
+        except Exception:
+            clip_name = None
+        
+        # Inspector properties go out in one loop with a single try/except
+        props: Dict[str, float] = {}
+        zoom = spec.get("zoom")
+        if zoom is not None:
+            start_zoom, end_zoom = zoom
+            if abs(end_zoom - 1.0) > 1e-3 or abs(start_zoom - 1.0) > 1e-3:
+                props["ZoomX"] = float(end_zoom)
+                props["ZoomY"] = float(end_zoom)
+        if "opacity" in spec:
+            props["Opacity"] = float(spec["opacity"]) * 100.0  # Inspector range is 0-100
+        results: Dict[str, bool] = {}
+        try:
+            for key, value in props.items():
+                results[key] = bool(clip.SetProperty(key, value))
+        except Exception as e:
+            print(f"[WARN] Could not set clip properties: {e}")
+        
+        if zoom is not None:
+            start_zoom, end_zoom = zoom
+            if results.get("ZoomX") and results.get("ZoomY"):
+                suffix = " (ramp TODO)" if abs(end_zoom - start_zoom) > 1e-3 else ""
+                self.modifications.append({
+                    "type": "zoom",
+                    "clip": clip_name,
+                    "value": f"Inspector Zoom: {start_zoom} -> {end_zoom}{suffix}"
+                })
+                applied["zoom"] = True
+            else:
+                applied["zoom"] = self._fusion_zoom(clip, start_zoom, end_zoom)
+        if "opacity" in spec:
+            applied["opacity"] = results.get("Opacity", False)
+            if applied["opacity"]:
+                self.modifications.append({
+                    "type": "opacity",
+                    "clip": clip_name,
+                    "value": f"{spec['opacity'] * 100:.0f}%"
+                })
+        
+        if "speed" in spec:
+            try:
+                clip.SetSpeed(spec["speed"])
+                self.modifications.append({
+                    "type": "speed",
+                    "clip": clip_name,
+                    "value": f"{spec['speed'] * 100:.0f}%"
+                })
+                applied["speed"] = True
+            except Exception as e:
+                print(f"[WARN] Could not set speed: {e}")
+                applied["speed"] = False
+        
+        if "trim" in spec:
+            left_offset, right_offset = spec["trim"]
+            try:
+                if left_offset > 0:
+                    clip.SetLeftOffset(left_offset)
+                if right_offset > 0:
+                    clip.SetRightOffset(right_offset)
+                self.modifications.append({
+                    "type": "trim",
+                    "clip": clip_name,
+                    "left_offset": left_offset,
+                    "right_offset": right_offset
+                })
+                applied["trim"] = True
+            except Exception as e:
+                print(f"[WARN] Could not trim clip: {e}")
+                applied["trim"] = False
+        
+        return applied
+    
     def trim_clip(self, clip: Any, left_offset: int, right_offset: int) -> bool:
         """Trim clip (offsets in frames)."""
         try:
@@ -673,76 +966,139 @@ class ClipModifier:
 # ============================================================================
 
 def load_editing_guide(json_path: str) -> Optional[Dict[str, Any]]:
-    """Load and parse editing guide JSON."""
+    """Load and parse editing guide JSON (uses orjson when installed)."""
     try:
-        with open(json_path, 'r') as f:
-            return json.load(f)
+        with open(json_path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        print(f"[ERROR] JSON file not found: {json_path}")
+        return None
+    except OSError as e:
+        print(f"[ERROR] Failed to read JSON: {e}")
+        return None
+    try:
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    except ValueError as e:
+        print(f"[ERROR] Failed to parse JSON: {e}")
+        return None
+
+def _iter_guide_edits(json_path: str) -> Iterable[Dict[str, Any]]:
+    with open(json_path, "rb") as f:
+        yield from ijson.items(f, "edits.item", use_float=True)
+
+def open_editing_guide(json_path: str) -> Optional[Tuple[Dict[str, Any], Iterable[Dict[str, Any]]]]:
+    """Return (meta, raw edits) for an editing guide.
+    With ijson installed, meta holds only project_name and video.source_path and
+    the edits are streamed; otherwise the whole guide is loaded once.
+    """
+    if ijson is None:
+        data = load_editing_guide(json_path)
+        if not data:
+            return None
+        return data, data.get("edits", [])
+    
+    meta: Dict[str, Any] = {}
+    try:
+        with open(json_path, "rb") as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == "project_name" and event == "string":
+                    meta["project_name"] = value
+                elif prefix == "video.source_path" and event == "string":
+                    meta.setdefault("video", {})["source_path"] = value
+                else:
+                    continue
+                # Stop at the second field instead of scanning the edits too
+                if "project_name" in meta and "video" in meta:
+                    break
+    except FileNotFoundError:
+        print(f"[ERROR] JSON file not found: {json_path}")
+        return None
     except Exception as e:
-        print(f"[ERROR] Failed to load JSON: {e}")
+        print(f"[ERROR] Failed to parse JSON: {e}")
         return None
+    return meta, _iter_guide_edits(json_path)
 
 
+def _todo_slow_motion(p: Dict[str, Any]) -> str:
+    speed_val = p.get("speed") or p.get("percent")
+    factor = p.get("factor")
+    if speed_val is not None:
+        return f"Retime: set speed to {speed_val}% via Retime Controls; enable Optical Flow if artifacting."
+    if factor is not None:
+        try:
+            pct = float(factor) * 100.0
+            return f"Retime: set speed to {pct:.0f}% via Retime Controls; enable Optical Flow if artifacting."
+        except Exception:
+            return "Retime: set slow-motion via Retime Controls; enable Optical Flow if artifacting."
+    return "Retime: adjust speed; enable Optical Flow if needed."
+
+def _todo_speed_ramp(p: Dict[str, Any]) -> str:
+    e = p.get("entry_speed")
+    s = p.get("slow_speed")
+    x = p.get("exit_speed")
+    plan = f"{e}-{s}-{x}" if e and s and x else "entry/slow/exit"
+    return f"Retime Curve: create speed ramp {plan}; ease handles to smooth transitions."
+
+def _todo_zoom(p: Dict[str, Any]) -> str:
+    sv = p.get("start") or p.get("start_zoom")
+    ev = p.get("end") or p.get("end_zoom")
+    if sv is not None and ev is not None and str(sv) != str(ev):
+        return f"Zoom: keyframe Transform Size from {sv} to {ev} over edit duration (or refine Fusion Transform)."
+    val = ev or sv or 1.0
+    return f"Zoom: set static ZoomX/Y to {val} in Inspector (fine-tune framing)."
+
+def _todo_color(p: Dict[str, Any]) -> str:
+    eff = p.get("effect") or "vignette/contrast"
+    cb = p.get("contrast_boost")
+    msg = f"Color: apply {eff}"
+    if cb:
+        msg += f"; adjust Contrast to {cb}"
+    return msg + "."
+
+def _todo_audio(p: Dict[str, Any], ttype: str) -> str:
+    level = p.get("level")
+    typ = p.get("type") or ttype
+    detail = f"Audio: {typ}"
+    if level is not None:
+        try:
+            detail += f" at {int(level)} dB"
+        except Exception:
+            detail += f" at {level}"
+    return detail + "; place on target audio track and balance with mix."
+
+# Separator between TODO bullets in marker notes
+_TODO_SEP = "\n- "
+
+# Technique type -> TODO builder
+_TODO_HANDLERS = {
+    "slow_motion": _todo_slow_motion,
+    "speed_ramp": _todo_speed_ramp,
+    "zoom": _todo_zoom,
+    "color_grade": _todo_color,
+    "sfx": lambda p: _todo_audio(p, "sfx"),
+    "audio_ducking": lambda p: _todo_audio(p, "audio_ducking"),
+}
+
 def build_todos_for_edit(edit: Dict[str, Any]) -> List[str]:
     """Generate detailed TODOs based on techniques and parameters."""
     todos: List[str] = []
-    for tech in edit.get("techniques", []):
-        ttype = (tech.get("type") or "").lower()
-        p = tech.get("parameters", {}) or {}
-        if ttype == "slow_motion":
-            speed_val = p.get("speed") or p.get("percent")
-            factor = p.get("factor")
-            if speed_val is not None:
-                todos.append(f"Retime: set speed to {speed_val}% via Retime Controls; enable Optical Flow if artifacting.")
-            elif factor is not None:
-                try:
-                    pct = float(factor) * 100.0
-                    todos.append(f"Retime: set speed to {pct:.0f}% via Retime Controls; enable Optical Flow if artifacting.")
-                except Exception:
-                    todos.append("Retime: set slow-motion via Retime Controls; enable Optical Flow if artifacting.")
-            else:
-                todos.append("Retime: adjust speed; enable Optical Flow if needed.")
-        elif ttype == "speed_ramp":
-            e = p.get("entry_speed")
-            s = p.get("slow_speed")
-            x = p.get("exit_speed")
-            plan = f"{e}-{s}-{x}" if e and s and x else "entry/slow/exit"
-            todos.append(f"Retime Curve: create speed ramp {plan}; ease handles to smooth transitions.")
-        elif ttype == "zoom":
-            sv = p.get("start") or p.get("start_zoom")
-            ev = p.get("end") or p.get("end_zoom")
-            if sv is not None and ev is not None and str(sv) != str(ev):
-                todos.append(f"Zoom: keyframe Transform Size from {sv} to {ev} over edit duration (or refine Fusion Transform).")
-            else:
-                val = ev or sv or 1.0
-                todos.append(f"Zoom: set static ZoomX/Y to {val} in Inspector (fine-tune framing).")
-        elif ttype == "color_grade":
-            eff = p.get("effect") or "vignette/contrast"
-            cb = p.get("contrast_boost")
-            msg = f"Color: apply {eff}"
-            if cb:
-                msg += f"; adjust Contrast to {cb}"
-            msg += "."
-            todos.append(msg)
-        elif ttype in ("sfx", "audio_ducking"):
-            level = p.get("level")
-            typ = p.get("type") or ttype
-            detail = f"Audio: {typ}"
-            if level is not None:
-                try:
-                    detail += f" at {int(level)} dB"
-                except Exception:
-                    detail += f" at {level}"
-            detail += "; place on target audio track and balance with mix."
-            todos.append(detail)
+    for tech in edit["techniques"]:
+        ttype = tech["type"]
+        handler = _TODO_HANDLERS.get(ttype)
+        if handler:
+            todos.append(handler(tech["parameters"]))
         else:
             todos.append(f"Technique '{ttype}': review and apply manually as needed.")
     return todos
 
-def normalize_edits(data: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Normalize edits from JSON."""
+def normalize_edits(data: Any) -> List[Dict[str, Any]]:
+    """Normalize edits from a guide dict or an iterable of raw edit records."""
     edits = []
+    raw_edits = data.get("edits", []) if isinstance(data, dict) else data
     
-    for idx, raw in enumerate(data.get("edits", []), 1):
+    for idx, raw in enumerate(raw_edits, 1):
         start_sec = parse_timecode_to_seconds(raw.get("start") or raw.get("start_time") or "00:00:00")
         end_sec = parse_timecode_to_seconds(raw.get("end") or raw.get("end_time") or "00:00:00")
         
@@ -751,6 +1107,7 @@ def normalize_edits(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         
         if end_f <= start_f:
             end_f = start_f + FPS
+        intensity = max(1, min(5, int(raw.get("intensity_1_5") or 3)))
         
         edit = {
             "id": str(raw.get("id") or f"E{idx:03d}"),
@@ -759,26 +1116,110 @@ def normalize_edits(data: Dict[str, Any]) -> List[Dict[str, Any]]:
             "end": end_sec,
             "start_f": start_f,
             "end_f": end_f,
-            "intensity": max(1, min(5, int(raw.get("intensity_1_5") or 3))),
+            # fps -> (start_f, end_f); see _frames_at()
+            "_frames": {FPS: (start_f, end_f)},
+            "intensity": intensity,
+            "color": INTENSITY_COLOR[intensity],
             "why_this_works": str(raw.get("why_this_works") or ""),
-            "techniques": raw.get("edits") or [],
+            # Types are lowercased and interned once here so dispatch sees canonical keys
+            "techniques": [
+                dict(tech, type=sys.intern((tech.get("type") or "unknown").lower()), parameters=tech.get("parameters") or {})
+                for tech in raw.get("edits") or []
+            ],
         }
         edits.append(edit)
     
     return edits
 
-def apply_edits_to_timeline(resolve: ResolveStudioWrapper, modifier: ClipModifier, edits: List[Dict[str, Any]], run_log: Dict[str, Any]) -> int:
+def _frames_at(edit: Dict[str, Any], fps: int) -> Tuple[int, int]:
+    """Edit (start_f, end_f) at fps, at least one second long. Cached on the edit."""
+    cache = edit.setdefault("_frames", {})
+    frames = cache.get(fps)
+    if frames is None:
+        start_f = seconds_to_frames(edit["start"], fps)
+        end_f = seconds_to_frames(edit["end"], fps)
+        if end_f <= start_f:
+            end_f = start_f + fps
+        frames = cache[fps] = (start_f, end_f)
+    return frames
+
+# Per-technique appliers for apply_edits_to_timeline. Speed and zoom only
+# compute (kind, value, note) so an edit's changes reach the clip in one
+# apply_clip_mods() call; Fusion effects map to (applied type, note builder).
+
+def _stage_speed(params: Dict[str, Any]) -> Tuple[str, float, str]:
+    # Accept percent, speed, or factor (0.5 = 50%)
+    speed_val = params.get("speed") or params.get("percent")
+    if speed_val is None and params.get("factor") is not None:
+        try:
+            speed_val = float(params.get("factor")) * 100.0
+        except Exception:
+            speed_val = 100.0
+    try:
+        speed = float(speed_val) if speed_val is not None else 100.0
+    except Exception:
+        speed = 100.0
+    return "speed", speed / 100.0, f"Speed: {speed}%"
+
+def _stage_zoom(params: Dict[str, Any]) -> Tuple[str, Tuple[float, float], str]:
+    # Accept start/end or start_zoom/end_zoom keys
+    try:
+        start_zoom = float(params.get("start_zoom") or params.get("start") or 1.0)
+    except Exception:
+        start_zoom = 1.0
+    try:
+        end_zoom = float(params.get("end_zoom") or params.get("end") or start_zoom)
+    except Exception:
+        end_zoom = start_zoom
+    return "zoom", (start_zoom, end_zoom), f"Zoom: {start_zoom} -> {end_zoom}"
+
+def _speed_ramp_note(params: Dict[str, Any]) -> str:
+    entry = params.get("entry_speed")
+    slow = params.get("slow_speed")
+    exit_spd = params.get("exit_speed")
+    return f"Speed ramp: Fusion comp created (plan {entry}-{slow}-{exit_spd})"
+
+_STAGED_CHANGES = {
+    "slow_motion": _stage_speed,
+    "zoom": _stage_zoom,
+}
+
+# Speed ramp is more complex than a SetSpeed - create Fusion comp placeholder
+_FUSION_EFFECTS = {
+    "speed_ramp": ("speed", _speed_ramp_note),
+    "color_grade": ("color", lambda params: "Color grade: Fusion comp created"),
+}
+
+_AUDIO_TECHNIQUES = frozenset(("sfx", "audio_ducking"))
+
+def _finalize_segment(resolve: ResolveStudioWrapper, seg: Any, edit: Dict[str, Any]) -> None:
+    """Name a Segments-timeline item after its edit and mark it."""
+    try:
+        seg.SetName(f"{edit['id']} - {edit['label']}")
+        resolve.add_clip_marker(seg, 0, edit["color"], f"{edit['id']} segment", "Highlight clip")
+    except Exception:
+        pass
+
+def apply_edits_to_timeline(resolve: ResolveStudioWrapper, modifier: ClipModifier, edits: List[Dict[str, Any]], run_log: Dict[str, Any], parallel: bool = False) -> int:
     """Apply edits to timeline and return count of modifications.
     Additionally, duplicates the source clip into per-edit segments on V2 (highlight reel),
     leaving V1 untouched. Segments are appended sequentially and trimmed to each edit.
+    With parallel=True the per-segment SetName/marker calls run on a small thread pool.
     """
     modifications_count = 0
     
     print_section("Applying Edits to Timeline")
+    if not edits:
+        # Nothing to place; avoid creating an empty Segments timeline
+        print("[INFO] No edits to apply")
+        return 0
 
+    # Resolve handles are fetched once here; every call is a round trip to Resolve.
     # Re-fetch the timeline object to ensure it is valid after potential changes.
-    resolve.current_timeline = resolve.current_project.GetCurrentTimeline()
-    print(f"[DEBUG] Timeline before getting clips: {resolve.current_timeline}")
+    project = resolve.current_project
+    resolve.current_timeline = project.GetCurrentTimeline()
+    if DEBUG:
+        print(f"[DEBUG] Timeline before getting clips: {resolve.current_timeline}")
 
     # Determine actual timeline FPS and record it
     try:
@@ -788,12 +1229,15 @@ def apply_edits_to_timeline(resolve: ResolveStudioWrapper, modifier: ClipModifie
         timeline_fps = FPS
     run_log["timeline_fps"] = timeline_fps
     
-    clips = modifier.get_timeline_clips()
+    tracks = modifier.get_timeline_tracks()
+    clips = [clip for track in tracks for clip in track]
     if not clips:
         print("[WARN] No clips found in timeline")
         return 0
     
     print(f"[✓] Found {len(clips)} clip(s) in timeline\n")
+    
+    modifier._build_clip_index(tracks)
 
     # Create separate Segments timeline with clips at original positions
     try:
@@ -816,39 +1260,37 @@ def apply_edits_to_timeline(resolve: ResolveStudioWrapper, modifier: ClipModifie
         else:
             # Create empty segments timeline and append each segment at original timecode
             try:
-                mp = resolve.current_project.GetMediaPool()
+                mp = project.GetMediaPool()
                 base_seg_name = f"Segments ({timeline_fps}fps)"
-                # Auto-unique name to avoid collisions
                 seg_name = base_seg_name
                 segments_tl = mp.CreateEmptyTimeline(seg_name)
                 if not segments_tl:
-                    from datetime import datetime as _dt
-                    ts = _dt.now().strftime("%Y-%m-%d_%H-%M-%S")
-                    for attempt in range(1, 6):
-                        seg_name = f"{base_seg_name} #{attempt}"
-                        segments_tl = mp.CreateEmptyTimeline(seg_name)
-                        if segments_tl:
-                            break
-                    if not segments_tl:
-                        seg_name = f"{base_seg_name} {ts}"
-                        segments_tl = mp.CreateEmptyTimeline(seg_name)
+                    # Name taken from an earlier run; a timestamp suffix is unique
+                    seg_name = f"{base_seg_name} {datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}"
+                    segments_tl = mp.CreateEmptyTimeline(seg_name)
                 if segments_tl:
-                    resolve.current_project.SetCurrentTimeline(segments_tl)
-                    print(f"[✓] Created empty Segments timeline '{seg_name}'; appending segments at source timecodes...")
-                    for edit in edits:
-                        start_f = seconds_to_frames(edit["start"], timeline_fps)
-                        end_f = seconds_to_frames(edit["end"], timeline_fps)
-                        if end_f <= start_f:
-                            end_f = start_f + timeline_fps
-                        seg = resolve.append_segment(media_item, start_f, end_f, 1, record_f=start_f, include_audio=True)
-                        if seg:
-                            try:
-                                seg.SetName(f"{edit['id']} - {edit['label']}")
-                                color = INTENSITY_COLOR.get(edit["intensity"], "Blue")
-                                resolve.add_clip_marker(seg, 0, color, f"{edit['id']} segment", "Highlight clip")
-                            except Exception:
-                                pass
-                    print("[✓] Segments appended")
+                    orig_timeline = resolve.current_timeline
+                    project.SetCurrentTimeline(segments_tl)
+                    try:
+                        print(f"[✓] Created empty Segments timeline '{seg_name}'; appending segments at source timecodes...")
+                        for edit in edits:
+                            start_f, end_f = _frames_at(edit, timeline_fps)
+                            resolve.queue_segment(media_item, start_f, end_f, 1, record_f=start_f, include_audio=True)
+                        # One AppendToTimeline call for the whole track
+                        segs = resolve.flush_segments()
+                        pairs = [(seg, edit) for edit, seg in zip(edits, segs) if seg]
+                        if parallel:
+                            # Each call touches a different segment, so they can overlap
+                            with ThreadPoolExecutor(max_workers=4) as pool:
+                                list(pool.map(lambda p: _finalize_segment(resolve, *p), pairs))
+                        else:
+                            for seg, edit in pairs:
+                                _finalize_segment(resolve, seg, edit)
+                        print("[✓] Segments appended")
+                    finally:
+                        # Back to the edited timeline for the per-edit pass below
+                        if orig_timeline:
+                            project.SetCurrentTimeline(orig_timeline)
                 else:
                     print("[WARN] Could not create segments timeline")
             except Exception as tl_err:
@@ -866,132 +1308,75 @@ def apply_edits_to_timeline(resolve: ResolveStudioWrapper, modifier: ClipModifie
             "modifications": [],
             "warnings": []
         }
-        applied_types: List[str] = []
+        # Insertion-ordered set: O(1) membership, first-applied order for the marker name
+        applied_types: Dict[str, None] = {}
+        # Frame positions at the actual timeline FPS, computed once per edit
+        start_f, end_f = _frames_at(edit, timeline_fps)
+        edit_color = edit["color"]
+        # Speed/zoom changes are collected and applied to the clip in one pass below
+        spec: Dict[str, Any] = {}
+        notes: Dict[str, str] = {}
         
-        # Process techniques/effects for this edit
-        for tech in edit.get("techniques", []):
-            tech_type = tech.get("type", "unknown")
-            params = tech.get("parameters", {})
-            
-            # Recompute frame positions at actual timeline FPS
-            start_f = seconds_to_frames(edit["start"], timeline_fps)
-            end_f = seconds_to_frames(edit["end"], timeline_fps)
-            if end_f <= start_f:
-                end_f = start_f + timeline_fps
-
-            # Find appropriate clip (simplified - matches by timecode proximity)
-            for clip in clips:
-                try:
-                    clip_start_f = clip.GetStart()
-                    clip_end_f = clip.GetEnd()
-                    if clip_start_f <= start_f < clip_end_f:
-                        
-                        # Apply modifications based on technique type
-                        if tech_type == "slow_motion":
-                            # Accept percent, speed, or factor (0.5 = 50%)
-                            speed_val = params.get("speed") or params.get("percent")
-                            if speed_val is None and params.get("factor") is not None:
-                                try:
-                                    speed_val = float(params.get("factor")) * 100.0
-                                except Exception:
-                                    speed_val = 100.0
-                            try:
-                                speed = float(speed_val) if speed_val is not None else 100.0
-                            except Exception:
-                                speed = 100.0
-                            if modifier.set_clip_speed(clip, speed / 100.0):
-                                edit_log["modifications"].append(f"Speed: {speed}%")
-                                if "speed" not in applied_types:
-                                    applied_types.append("speed")
-                                modifications_count += 1
-                        
-                        elif tech_type == "speed_ramp":
-                            # Speed ramp is more complex - create Fusion comp placeholder
-                            if modifier.create_fusion_effect(clip, "speed_ramp"):
-                                entry = params.get("entry_speed")
-                                slow = params.get("slow_speed")
-                                exit_spd = params.get("exit_speed")
-                                edit_log["modifications"].append(
-                                    f"Speed ramp: Fusion comp created (plan {entry}-{slow}-{exit_spd})"
-                                )
-                                if "speed" not in applied_types:
-                                    applied_types.append("speed")
-                                modifications_count += 1
-                        
-                        elif tech_type == "zoom":
-                            # Accept start/end or start_zoom/end_zoom keys
-                            try:
-                                start_zoom = float(params.get("start_zoom") or params.get("start") or 1.0)
-                            except Exception:
-                                start_zoom = 1.0
-                            try:
-                                end_zoom = float(params.get("end_zoom") or params.get("end") or start_zoom)
-                            except Exception:
-                                end_zoom = start_zoom
-                            if modifier.set_clip_zoom(clip, start_zoom, end_zoom):
-                                edit_log["modifications"].append(f"Zoom: {start_zoom} -> {end_zoom}")
-                                if "zoom" not in applied_types:
-                                    applied_types.append("zoom")
-                                modifications_count += 1
-                        
-                        elif tech_type == "color_grade":
-                            if modifier.create_fusion_effect(clip, "color_grade"):
-                                edit_log["modifications"].append("Color grade: Fusion comp created")
-                                if "color" not in applied_types:
-                                    applied_types.append("color")
-                                modifications_count += 1
-                        
-                        elif tech_type == "sfx" or tech_type == "audio_ducking":
-                            edit_log["warnings"].append(f"Audio effect '{tech_type}' requires manual setup on audio track")
-                        
-                        # Break after processing this clip
-                        break
-                
-                except Exception as e:
-                    edit_log["warnings"].append(f"Error processing {tech_type}: {e}")
+        # Process techniques/effects on the clip containing the edit start
+        clip = modifier.find_clip_at_frame(start_f)
+        for tech in edit["techniques"] if clip is not None else ():
+            tech_type = tech["type"]
+            params = tech["parameters"]
+            try:
+                stage = _STAGED_CHANGES.get(tech_type)
+                if stage is not None:
+                    kind, value, note = stage(params)
+                    spec[kind] = value
+                    notes[kind] = note
+                elif tech_type in _FUSION_EFFECTS:
+                    kind, describe = _FUSION_EFFECTS[tech_type]
+                    if modifier.create_fusion_effect(clip, tech_type):
+                        edit_log["modifications"].append(describe(params))
+                        applied_types[kind] = None
+                        modifications_count += 1
+                elif tech_type in _AUDIO_TECHNIQUES:
+                    edit_log["warnings"].append(f"Audio effect '{tech_type}' requires manual setup on audio track")
+            except Exception as e:
+                edit_log["warnings"].append(f"Error processing {tech_type}: {e}")
+        
+        # Apply the collected speed/zoom changes with one call per clip
+        if spec:
+            for kind, ok in modifier.apply_clip_mods(clip, spec).items():
+                if ok:
+                    edit_log["modifications"].append(notes[kind])
+                    applied_types[kind] = None
+                    modifications_count += 1
         
         # Color-code nearest clip based on intensity
-        chosen_clip = None
         try:
-            start_f = seconds_to_frames(edit["start"], timeline_fps)
-            for clip in clips:
-                try:
-                    clip_start = clip.GetStart()
-                    if abs(clip_start - start_f) < timeline_fps * 2:
-                        color = INTENSITY_COLOR.get(edit["intensity"], "Blue")
-                        if modifier.set_clip_color(clip, color):
-                            edit_log["modifications"].append(f"Color tag: {color}")
-                            modifications_count += 1
-                        chosen_clip = clip
-                        break
-                except Exception:
-                    continue
+            chosen_clip = modifier.find_nearest_clip(start_f, timeline_fps * 2)
+            if chosen_clip is not None and modifier.set_clip_color(chosen_clip, edit_color):
+                edit_log["modifications"].append(f"Color tag: {edit_color}")
+                modifications_count += 1
         except Exception as e:
             edit_log["warnings"].append(f"Could not color-code clip: {e}")
         
         # Add a timeline marker documenting the edit and applied mods
         try:
-            color = INTENSITY_COLOR.get(edit["intensity"], "Blue")
+            # One f-string per section; no intermediate "prefix + join" strings
             note_lines = []
-            if edit.get("why_this_works"):
+            if edit["why_this_works"]:
                 note_lines.append(f"Why: {edit['why_this_works']}")
             if edit_log["modifications"]:
-                note_lines.append("Applied: " + "; ".join(edit_log["modifications"]))
+                note_lines.append(f"Applied: {'; '.join(edit_log['modifications'])}")
             todos = build_todos_for_edit(edit)
             if todos:
-                note_lines.append("TODOs:\n- " + "\n- ".join(todos))
+                note_lines.append(f"TODOs:\n- {_TODO_SEP.join(todos)}")
             if edit_log["warnings"]:
-                note_lines.append("Warnings: " + "; ".join(edit_log["warnings"]))
+                note_lines.append(f"Warnings: {'; '.join(edit_log['warnings'])}")
             note = "\n".join(note_lines) if note_lines else "Planned edit"
-            start_f = seconds_to_frames(edit["start"], timeline_fps)
-            end_f = seconds_to_frames(edit["end"], timeline_fps)
             duration = max(0, end_f - start_f)
             # Include types in the marker name for quick scanning
             if applied_types:
                 marker_name = f"{edit['label']} [{', '.join(applied_types)}]"
             else:
                 marker_name = edit["label"]
-            resolve.add_marker(start_f, color, marker_name, note, duration)
+            resolve.add_marker(start_f, edit_color, marker_name, note, duration)
         except Exception as e:
             edit_log["warnings"].append(f"Could not add marker: {e}")
         
@@ -999,6 +1384,8 @@ def apply_edits_to_timeline(resolve: ResolveStudioWrapper, modifier: ClipModifie
         print(f"  ├─ Modifications: {len(edit_log['modifications'])}")
         if edit_log["warnings"]:
             print(f"  └─ Warnings: {len(edit_log['warnings'])}")
+        if edit_idx % PROGRESS_FLUSH_EVERY == 0:
+            sys.stdout.flush()
     
     return modifications_count
 
@@ -1006,19 +1393,37 @@ def apply_edits_to_timeline(resolve: ResolveStudioWrapper, modifier: ClipModifie
 # MAIN
 # ============================================================================
 
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser on first use and reuse it for later main() calls."""
+    global _PARSER
+    if _PARSER is None:
+        parser = argparse.ArgumentParser(
+            description="DaVinci Resolve Studio - Automated Clip Modification"
+        )
+        parser.add_argument("--json", help="Path to editing_guide.json")
+        parser.add_argument("--project-name", help="Resolve project name")
+        parser.add_argument("--dry-run", action="store_true", help="Plan without modifying")
+        parser.add_argument("--fps", type=int, default=FPS, help="Timeline FPS (default 30)")
+        parser.add_argument("--color-preset", default=DEFAULT_COLOR_PRESET)
+        parser.add_argument("--vignette-preset", default=DEFAULT_VIGNETTE_PRESET)
+        parser.add_argument("--parallel", action="store_true",
+                            help="Name and mark segments from a thread pool (not every Resolve build is thread-safe)")
+        _PARSER = parser
+    return _PARSER
+
 def main():
-    parser = argparse.ArgumentParser(
-        description="DaVinci Resolve Studio - Automated Clip Modification"
-    )
-    parser.add_argument("--json", help="Path to editing_guide.json")
-    parser.add_argument("--project-name", help="Resolve project name")
-    parser.add_argument("--dry-run", action="store_true", help="Plan without modifying")
-    parser.add_argument("--fps", type=int, default=FPS, help="Timeline FPS (default 30)")
-    parser.add_argument("--color-preset", default=DEFAULT_COLOR_PRESET)
-    parser.add_argument("--vignette-preset", default=DEFAULT_VIGNETTE_PRESET)
-    
+    parser = _get_parser()
     args = parser.parse_args()
     
+    # Per-edit progress lines are block-buffered and flushed every
+    # PROGRESS_FLUSH_EVERY edits instead of once per line on a TTY
+    try:
+        sys.stdout.reconfigure(line_buffering=False)
+    except (AttributeError, ValueError):
+        pass
+    
     # Get JSON path from args or env
     json_path = args.json or os.getenv("EDITING_GUIDE_JSON")
     
@@ -1027,21 +1432,22 @@ def main():
         parser.print_help()
         sys.exit(2)
     
-    if not Path(json_path).exists():
-        print(f"[ERROR] JSON file not found: {json_path}")
-        sys.exit(1)
-    
     print_section("DaVinci Resolve Studio - Automated Editing Guide Application")
     print(f"JSON Path: {json_path}")
     print(f"Dry Run: {args.dry_run}")
     
     # Load editing guide
     print("\n[INFO] Loading editing guide...")
-    data = load_editing_guide(json_path)
-    if not data:
+    guide = open_editing_guide(json_path)
+    if not guide:
         sys.exit(1)
+    data, raw_edits = guide
     
-    edits = normalize_edits(data)
+    try:
+        edits = normalize_edits(raw_edits)
+    except Exception as e:
+        print(f"[ERROR] Failed to parse JSON: {e}")
+        sys.exit(1)
     print(f"[✓] Loaded {len(edits)} edits")
     
     # Initialize run log
@@ -1085,7 +1491,7 @@ def main():
         
         # Apply modifications
         modifier = ClipModifier(resolve_wrap)
-        modifications = apply_edits_to_timeline(resolve_wrap, modifier, edits, run_log)
+        modifications = apply_edits_to_timeline(resolve_wrap, modifier, edits, run_log, parallel=args.parallel)
         
         run_log["status"] = "completed"
         run_log["modifications_applied"] = modifications
@@ -1095,8 +1501,11 @@ def main():
     print(f"\n[INFO] Writing run log: {log_path}")
     
     try:
-        with open(log_path, 'w') as f:
-            json.dump(run_log, f, indent=2)
+        with open(log_path, 'wb') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(run_log, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(run_log, indent=2).encode("utf-8"))
         print(f"[✓] Run log written")
     except Exception as e:
         print(f"[ERROR] Failed to write run log: {e}")
@@ -1108,6 +1517,7 @@ def main():
     else:
         print(f"Applied {run_log.get('modifications_applied', 0)} modifications to timeline.")
     print(f"Log: {log_path}")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
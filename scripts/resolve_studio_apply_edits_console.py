@@ -19,13 +19,40 @@ Features:
     - Comprehensive console feedback
 """
 
+import io
 import json
 import os
 import sys
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
+
+# Shared helpers (timecodes, colors, clip lookups) live next to this script
+_SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
+from resolve_common import (
+    FPS,
+    INTENSITY_COLOR,
+    match_edits_to_clips,
+    parse_timecode_to_seconds,
+    seconds_to_frames,
+    snapshot_clips,
+)
+
+# Optional fast JSON parser; falls back to the stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Optional streaming JSON parser for large editing guides
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # DaVinci Resolve Python API
 try:
@@ -38,56 +65,31 @@ except ImportError:
         print("[ERROR] Could not import DaVinciResolveScript module")
         sys.exit(1)
 
-# ============================================================================
-# CONSTANTS
-# ============================================================================
-
-FPS = 30
-
-INTENSITY_COLOR = {
-    1: "Green",
-    2: "Cyan",
-    3: "Yellow",
-    4: "Orange",
-    5: "Red",
-}
-
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def log(msg: str):
-    """Print to console with [RESOLVE] prefix."""
-    print(f"[RESOLVE] {msg}")
+# log() lines are buffered and written to stdout in batches of _LOG_FLUSH_EVERY
+_LOG_BUF = io.StringIO()
+_LOG_CT = 0
+_LOG_FLUSH_EVERY = 64
 
-def parse_timecode_to_seconds(tc: str) -> float:
-    """Convert HH:MM:SS or MM:SS or seconds to float seconds."""
-    if not tc or tc == "":
-        return 0
-    
-    try:
-        return float(tc)
-    except ValueError:
-        pass
-    
-    parts = tc.split(":")
-    try:
-        if len(parts) == 3:
-            h, m, s = [int(p) for p in parts]
-            return h * 3600 + m * 60 + s
-        elif len(parts) == 2:
-            m, s = [int(p) for p in parts]
-            return m * 60 + s
-        elif len(parts) == 1:
-            return int(float(parts[0]))
-    except (ValueError, IndexError):
-        pass
-    
-    return 0
+def flush_log():
+    """Write any buffered log lines to stdout."""
+    data = _LOG_BUF.getvalue()
+    if data:
+        sys.stdout.write(data)
+        sys.stdout.flush()
+        _LOG_BUF.seek(0)
+        _LOG_BUF.truncate(0)
 
-def seconds_to_frames(seconds: float, fps: int = FPS) -> int:
-    """Convert seconds to frame count."""
-    return int(round(seconds * fps))
+def log(msg: str):
+    """Print to console with [RESOLVE] prefix (buffered, see flush_log)."""
+    global _LOG_CT
+    _LOG_BUF.write(f"[RESOLVE] {msg}\n")
+    _LOG_CT += 1
+    if _LOG_CT % _LOG_FLUSH_EVERY == 0:
+        flush_log()
 
 # ============================================================================
 # RESOLVE API FUNCTIONS (Procedural approach)
@@ -187,24 +189,6 @@ def append_clip_to_timeline(project, media_item):
     
     return False
 
-def get_timeline_clips(project):
-    """Get all video clips from current timeline."""
-    clips = []
-    try:
-        timeline = project.GetCurrentTimeline()
-        if not timeline:
-            return clips
-        
-        track_count = timeline.GetTrackCount("video")
-        for track_idx in range(1, track_count + 1):
-            items = timeline.GetItemListInTrack("video", track_idx)
-            if items:
-                clips.extend(items)
-    except Exception as e:
-        log(f"✗ Failed to get clips: {e}")
-    
-    return clips
-
 def apply_speed_to_clip(clip, speed_factor: float) -> bool:
     """Apply speed change to clip."""
     try:
@@ -252,81 +236,105 @@ def set_clip_color(clip, color: str) -> bool:
 # ============================================================================
 
 def load_editing_guide(json_path: str) -> Optional[Dict[str, Any]]:
-    """Load and parse editing guide JSON."""
+    """Load and parse editing guide JSON (uses orjson when installed)."""
     try:
-        with open(json_path, 'r') as f:
-            return json.load(f)
+        with open(json_path, "rb") as f:
+            return _loads(f.read())
     except Exception as e:
         log(f"✗ Failed to load JSON: {e}")
         return None
 
-def normalize_edits(data: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Normalize edits from JSON."""
-    edits = []
-    
-    for idx, raw in enumerate(data.get("edits", []), 1):
-        start_sec = parse_timecode_to_seconds(raw.get("start") or "00:00:00")
-        end_sec = parse_timecode_to_seconds(raw.get("end") or "00:00:00")
-        
-        start_f = seconds_to_frames(start_sec)
-        end_f = seconds_to_frames(end_sec)
-        
-        if end_f <= start_f:
-            end_f = start_f + FPS
-        
-        edit = {
-            "id": str(raw.get("id") or f"E{idx:03d}"),
-            "label": str(raw.get("label") or f"Edit {idx}"),
-            "start": start_sec,
-            "end": end_sec,
-            "start_f": start_f,
-            "end_f": end_f,
-            "intensity": max(1, min(5, int(raw.get("intensity_1_5") or 3))),
-            "techniques": raw.get("edits") or [],
-        }
-        edits.append(edit)
-    
-    return edits
+def iter_guide_edits(json_path: str) -> Iterator[Dict[str, Any]]:
+    """Yield raw edit records one at a time without loading the whole guide (needs ijson)."""
+    with open(json_path, "rb") as f:
+        yield from ijson.items(f, "edits.item", use_float=True)
+
+def _normalize_one(idx: int, raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a single raw edit record (idx is 1-based, used for defaults)."""
+    get = raw.get
+    start_sec = parse_timecode_to_seconds(get("start") or "00:00:00")
+    end_sec = parse_timecode_to_seconds(get("end") or "00:00:00")
+    
+    start_f = seconds_to_frames(start_sec)
+    end_f = seconds_to_frames(end_sec)
+    
+    if end_f <= start_f:
+        end_f = start_f + FPS
+    
+    # Default id/label strings are only formatted when the guide omits them
+    rid = get("id")
+    label = get("label")
+    intensity = int(get("intensity_1_5") or 3)
+    
+    return {
+        "id": str(rid) if rid else f"E{idx:03d}",
+        "label": str(label) if label else f"Edit {idx}",
+        "start": start_sec,
+        "end": end_sec,
+        "start_f": start_f,
+        "end_f": end_f,
+        "intensity": 1 if intensity < 1 else 5 if intensity > 5 else intensity,
+        "techniques": get("edits") or [],
+    }
+
+def normalize_edits(data: Any) -> List[Dict[str, Any]]:
+    """Normalize edits from a guide dict or an iterable of raw edit records."""
+    raw_edits = data.get("edits", []) if isinstance(data, dict) else data
+    return [_normalize_one(idx, raw) for idx, raw in enumerate(raw_edits, 1)]
+
+# Technique handlers: (clip, parameters) -> (applied, message to log or None)
+
+def _h_slow(clip, params: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    factor = float(params.get("factor", 0.7))
+    if apply_speed_to_clip(clip, factor):
+        return True, f"  ✓ Speed: {factor * 100:.0f}%"
+    return False, None
+
+def _h_speed_ramp(clip, params: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    clip.AddFusionComp()
+    return True, "  ✓ Speed ramp: Fusion comp added (configure manually)"
+
+def _h_zoom(clip, params: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    start_zoom = float(params.get("start_zoom", 1.0))
+    end_zoom = float(params.get("end_zoom", 1.0))
+    return apply_zoom_to_clip(clip, start_zoom, end_zoom), None
+
+def _h_color_grade(clip, params: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    return apply_color_grade_to_clip(clip), None
+
+_HANDLERS: Dict[str, Callable[[Any, Dict[str, Any]], Tuple[bool, Optional[str]]]] = {
+    "slow_motion": _h_slow,
+    "speed_ramp": _h_speed_ramp,
+    "zoom": _h_zoom,
+    "color_grade": _h_color_grade,
+}
 
 def apply_edit_to_clip(clip, edit: Dict[str, Any]) -> int:
     """Apply all techniques from an edit to a clip."""
     modifications = 0
-    
-    for tech in edit.get("techniques", []):
-        tech_type = tech.get("type", "unknown")
-        params = tech.get("parameters", {})
+    handler_for = _HANDLERS.get
+    
+    for tech in edit.get("techniques") or ():
+        get = tech.get
+        tech_type = get("type", "unknown")
+        handler = handler_for(tech_type)
+        if handler is None:
+            log(f"  • {tech_type}: not yet implemented")
+            continue
         
         try:
-            if tech_type == "slow_motion":
-                factor = float(params.get("factor", 0.7))
-                if apply_speed_to_clip(clip, factor):
-                    log(f"  ✓ Speed: {factor * 100:.0f}%")
-                    modifications += 1
-            
-            elif tech_type == "speed_ramp":
-                fusion = clip.AddFusionComp()
-                log(f"  ✓ Speed ramp: Fusion comp added (configure manually)")
-                modifications += 1
-            
-            elif tech_type == "zoom":
-                start_zoom = float(params.get("start_zoom", 1.0))
-                end_zoom = float(params.get("end_zoom", 1.0))
-                if apply_zoom_to_clip(clip, start_zoom, end_zoom):
-                    modifications += 1
-            
-            elif tech_type == "color_grade":
-                if apply_color_grade_to_clip(clip):
-                    modifications += 1
-            
-            else:
-                log(f"  • {tech_type}: not yet implemented")
-        
+            ok, msg = handler(clip, get("parameters", {}))
         except Exception as e:
             log(f"  ✗ Error applying {tech_type}: {e}")
+            continue
+        if msg:
+            log(msg)
+        if ok:
+            modifications += 1
     
     # Color-code clip by intensity
     try:
-        color = INTENSITY_COLOR.get(edit["intensity"], "Blue")
+        color = INTENSITY_COLOR[edit["intensity"]]
         if set_clip_color(clip, color):
             log(f"  ✓ Color: {color}")
             modifications += 1
@@ -335,6 +343,30 @@ def apply_edit_to_clip(clip, edit: Dict[str, Any]) -> int:
     
     return modifications
 
+def merge_edits_by_clip(edits: List[Dict[str, Any]], matched: List[Optional[Any]]) -> List[Tuple[Any, Dict[str, Any]]]:
+    """Coalesce edits matched to the same clip into one edit per clip, in first-seen
+    order: ids/labels are joined, intensity is the max, techniques are the union."""
+    by_clip: Dict[int, Tuple[Any, Dict[str, Any], set]] = {}
+    for edit, clip in zip(edits, matched):
+        if clip is None:
+            continue
+        entry = by_clip.get(id(clip))
+        if entry is None:
+            merged = dict(edit, techniques=[])
+            entry = by_clip[id(clip)] = (clip, merged, set())
+        else:
+            merged = entry[1]
+            merged["id"] += f"+{edit['id']}"
+            merged["label"] += f" / {edit['label']}"
+            merged["intensity"] = max(merged["intensity"], edit["intensity"])
+        seen = entry[2]
+        for tech in edit.get("techniques", []):
+            key = json.dumps(tech, sort_keys=True, default=str)
+            if key not in seen:
+                seen.add(key)
+                merged["techniques"].append(tech)
+    return [(clip, merged) for clip, merged, _ in by_clip.values()]
+
 def apply_edits_to_timeline(project, edits: List[Dict[str, Any]]) -> int:
     """Apply all edits to timeline clips."""
     total_modifications = 0
@@ -343,35 +375,31 @@ def apply_edits_to_timeline(project, edits: List[Dict[str, Any]]) -> int:
     log("Processing Edits")
     log("=" * 80)
     
-    # Get clips from timeline
-    clips = get_timeline_clips(project)
-    if not clips:
+    # One sweep over the tracks; matching below never calls back into Resolve
+    try:
+        timeline = project.GetCurrentTimeline()
+    except Exception as e:
+        log(f"✗ Failed to get clips: {e}")
+        timeline = None
+    tracks = snapshot_clips(timeline, warn=lambda msg: log(f"  ! {msg}"))
+    clip_count = sum(len(clips) for _, _, clips in tracks)
+    if not clip_count:
         log("✗ No clips found in timeline")
         return 0
     
-    log(f"✓ Found {len(clips)} clip(s) in timeline\n")
+    log(f"✓ Found {clip_count} clip(s) in timeline\n")
     
-    for edit_idx, edit in enumerate(edits, 1):
-        log(f"[{edit_idx}/{len(edits)}] {edit['id']}: {edit['label']} (intensity {edit['intensity']})")
-        
-        # Find clip that matches edit timecode
-        clip_found = False
-        for clip in clips:
-            try:
-                clip_start_f = clip.GetStart()
-                clip_end_f = clip.GetEnd()
-                
-                # Check if edit start time falls within clip range
-                if clip_start_f <= edit["start_f"] < clip_end_f:
-                    modifications = apply_edit_to_clip(clip, edit)
-                    total_modifications += modifications
-                    clip_found = True
-                    break
-            except Exception as e:
-                log(f"  ! Error checking clip: {e}")
-        
-        if not clip_found:
-            log(f"  ⚠ No clip found at timecode {edit['start']}")
+    matched = match_edits_to_clips(edits, tracks)
+    for edit, clip in zip(edits, matched):
+        if clip is None:
+            log(f"  ⚠ No clip found for {edit['id']} at timecode {edit['start']}")
+    
+    # Edits landing on the same clip are applied together in one call
+    groups = merge_edits_by_clip(edits, matched)
+    total = len(groups)
+    for group_idx, (clip, edit) in enumerate(groups, 1):
+        log(f"[{group_idx}/{total}] {edit['id']}: {edit['label']} (intensity {edit['intensity']})")
+        total_modifications += apply_edit_to_clip(clip, edit)
     
     return total_modifications
 
@@ -399,12 +427,18 @@ def main():
     log("=" * 80)
     log(f"\n[1] Loading editing guide: {args.guide}")
     
-    # Load editing guide
-    data = load_editing_guide(args.guide)
-    if not data:
-        sys.exit(1)
-    
-    edits = normalize_edits(data)
+    # Load editing guide; with ijson the edits are normalized as they are parsed
+    if ijson is not None:
+        try:
+            edits = normalize_edits(iter_guide_edits(args.guide))
+        except Exception as e:
+            log(f"✗ Failed to load JSON: {e}")
+            sys.exit(1)
+    else:
+        data = load_editing_guide(args.guide)
+        if not data:
+            sys.exit(1)
+        edits = normalize_edits(data)
     log(f"✓ Loaded {len(edits)} edits\n")
     
     # Connect to Resolve
@@ -447,4 +481,8 @@ def main():
     log("=" * 80)
 
 if __name__ == "__main__":
-    main()
+    # Resolve's console keeps the interpreter alive, so flush explicitly
+    try:
+        main()
+    finally:
+        flush_log()
@@ -0,0 +1,394 @@
+import sys
+import json
+import importlib.util
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "resolve_studio_apply_edits.py"
+
+
+def load_module(monkeypatch, tmp_path):
+    # Keep Resolve discovery away from the real home directory
+    monkeypatch.setenv("HOME", str(tmp_path))
+    sys.modules.pop("resolve_studio_apply_edits", None)
+    spec = importlib.util.spec_from_file_location("resolve_studio_apply_edits", SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class FakeItem:
+    def __init__(self, start):
+        self.start = start
+
+    def GetStart(self):
+        return self.start
+
+
+class FakeTimeline:
+    def __init__(self):
+        self.tracks = {}
+
+    def GetItemListInTrack(self, kind, index):
+        return list(self.tracks.get(index, []))
+
+
+class FakeMediaPool:
+    def __init__(self, timeline):
+        self.timeline = timeline
+        self.calls = []
+
+    def AppendToTimeline(self, infos):
+        self.calls.append(list(infos))
+        items = []
+        for info in infos:
+            item = FakeItem(info["recordFrame"])
+            self.timeline.tracks.setdefault(info["trackIndex"], []).append(item)
+            items.append(item)
+        return items
+
+
+class FakeProject:
+    def __init__(self):
+        self.timeline = FakeTimeline()
+        self.media_pool = FakeMediaPool(self.timeline)
+
+    def GetMediaPool(self):
+        return self.media_pool
+
+    def GetCurrentTimeline(self):
+        return self.timeline
+
+
+class FakeResolve:
+    def GetProjectManager(self):
+        return None
+
+
+def make_wrapper(mod, monkeypatch):
+    monkeypatch.setattr(mod, "RESOLVE", FakeResolve())
+    wrapper = mod.ResolveStudioWrapper()
+    wrapper.current_project = FakeProject()
+    wrapper.current_timeline = wrapper.current_project.timeline
+    return wrapper
+
+
+def test_flush_segments_appends_queue_in_one_call(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+    wrapper = make_wrapper(mod, monkeypatch)
+
+    wrapper.queue_segment("media", 30, 90, 1, record_f=30)
+    wrapper.queue_segment("media", 300, 330, 1, record_f=300)
+    segs = wrapper.flush_segments()
+
+    calls = wrapper.current_project.media_pool.calls
+    assert len(calls) == 1
+    assert [info["recordFrame"] for info in calls[0]] == [30, 300]
+    assert [seg.GetStart() for seg in segs] == [30, 300]
+    assert wrapper.flush_segments() == []
+
+
+def test_parse_timecode_to_seconds_formats(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+
+    assert mod.parse_timecode_to_seconds("01:02:03") == 3723
+    assert mod.parse_timecode_to_seconds("05:22") == 322
+    assert mod.parse_timecode_to_seconds("42") == 42
+    assert mod.parse_timecode_to_seconds("12.5") == 12.5
+    assert mod.parse_timecode_to_seconds("00:01:02.5") == 62.5
+    assert mod.parse_timecode_to_seconds(" 01:00 ") == 60
+    assert mod.parse_timecode_to_seconds("1:2:3:4") == 0
+    assert mod.parse_timecode_to_seconds("01:02:03\n") == 3723
+    assert mod.parse_timecode_to_seconds(90) == 90
+    assert mod.parse_timecode_to_seconds("") == 0
+    assert mod.parse_timecode_to_seconds("not a time") == 0
+
+
+def test_get_resolve_env_override_beats_cached_path(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+    for name in ("stale", "override"):
+        module_dir = tmp_path / name
+        module_dir.mkdir()
+        (module_dir / "DaVinciResolveScript.py").write_text(f"def scriptapp(app):\n    return {name!r}\n")
+    mod.RESOLVE_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    mod.RESOLVE_PATH_CACHE.write_text(str(tmp_path / "stale"))
+    monkeypatch.setenv("RESOLVE_SCRIPT_API", str(tmp_path / "override"))
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.delitem(sys.modules, "DaVinciResolveScript", raising=False)
+
+    assert mod.GetResolve() == "override"
+    sys.modules.pop("DaVinciResolveScript", None)
+
+
+def test_find_media_io_stops_early(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+    attrs_calls = []
+
+    class Tool:
+        def __init__(self, reg_id):
+            self.ID = reg_id
+
+        def GetAttrs(self):
+            attrs_calls.append(self.ID)
+            return {}
+
+    class Comp:
+        def GetToolList(self, include_names=False):
+            return {1: Tool("MediaIn"), 2: Tool("MediaOut"), 3: Tool("Blur")}
+
+    modifier = mod.ClipModifier(resolve_wrapper=None)
+    media_in, media_out = modifier._find_media_io(Comp())
+    assert (media_in.ID, media_out.ID) == ("MediaIn", "MediaOut")
+    assert attrs_calls == []
+
+
+def test_apply_clip_mods_batches_speed_and_zoom(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+
+    class Clip:
+        def __init__(self):
+            self.props = {}
+            self.speed = None
+
+        def GetName(self):
+            return "clip"
+
+        def SetProperty(self, key, value):
+            self.props[key] = value
+            return True
+
+        def SetSpeed(self, factor):
+            self.speed = factor
+
+    modifier = mod.ClipModifier(resolve_wrapper=None)
+    clip = Clip()
+    applied = modifier.apply_clip_mods(clip, {"speed": 0.5, "zoom": (1.0, 1.2)})
+
+    assert applied == {"zoom": True, "speed": True}
+    assert clip.props == {"ZoomX": 1.2, "ZoomY": 1.2}
+    assert clip.speed == 0.5
+    assert [m["type"] for m in modifier.modifications] == ["zoom", "speed"]
+
+
+def test_compute_offsets_clamps_to_clip(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+
+    offsets = mod._compute_offsets([30, -5, 100], [90, 10, 100], [300, 300, 120])
+    assert offsets == [(30, 60, 210), (0, 15, 285), (100, 1, 19)]
+
+
+def test_ensure_video_track_adds_missing_tracks_then_counts_once(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+    wrapper = make_wrapper(mod, monkeypatch)
+
+    class Timeline:
+        def __init__(self):
+            self.count = 1
+            self.count_calls = 0
+
+        def GetTrackCount(self, kind):
+            self.count_calls += 1
+            return self.count
+
+        def AddTrack(self, kind, index=None):
+            if index is None:
+                raise TypeError("index required")
+            self.count += 1
+
+    tl = Timeline()
+    wrapper.current_timeline = tl
+    assert wrapper.ensure_video_track(4)
+    assert tl.count == 4
+    assert tl.count_calls == 2
+    assert wrapper._add_track_with_index is True
+    assert wrapper.ensure_video_track(3)
+    assert tl.count_calls == 2
+
+
+def test_import_media_reuses_pooled_clip(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+    wrapper = make_wrapper(mod, monkeypatch)
+    media = tmp_path / "match.mp4"
+    media.write_bytes(b"")
+
+    class PoolClip:
+        def GetClipProperty(self, key):
+            return str(media)
+
+    class Folder:
+        def GetClipList(self):
+            return [PoolClip()]
+
+    pool = wrapper.current_project.media_pool
+    pool.GetRootFolder = lambda: Folder()
+    pool.ImportMedia = lambda paths: (_ for _ in ()).throw(AssertionError("re-imported"))
+    appended = []
+    pool.AppendToTimeline = appended.extend
+
+    assert wrapper.import_media(str(media))
+    assert len(appended) == 1
+
+
+def test_frames_at_caches_per_fps(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+
+    (edit,) = mod.normalize_edits({"edits": [{"start": "00:00:10", "end": "00:00:10"}]})
+    assert mod._frames_at(edit, mod.FPS) == (300, 330)
+    assert mod._frames_at(edit, 25) == (250, 275)
+    assert set(edit["_frames"]) == {mod.FPS, 25}
+
+
+class EditClip:
+    def __init__(self, name, start, end):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.props = {}
+        self.speed = None
+        self.color = None
+
+    def GetName(self):
+        return self.name
+
+    def GetStart(self):
+        return self.start
+
+    def GetEnd(self):
+        return self.end
+
+    def GetMediaPoolItem(self):
+        return None
+
+    def SetProperty(self, key, value):
+        self.props[key] = value
+        return True
+
+    def SetSpeed(self, factor):
+        self.speed = factor
+
+    def SetClipColor(self, color):
+        self.color = color
+
+
+def test_apply_edits_to_timeline_dispatches_techniques(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+    wrapper = make_wrapper(mod, monkeypatch)
+    markers = []
+    wrapper.current_project.GetSetting = lambda key: "30"
+    wrapper.current_project.timeline.AddMarker = lambda *args: markers.append(args)
+
+    clips = [EditClip("a", 0, 300), EditClip("b", 300, 900)]
+    modifier = mod.ClipModifier(wrapper)
+    monkeypatch.setattr(modifier, "get_timeline_tracks", lambda: [clips])
+    edits = mod.normalize_edits({"edits": [{
+        "label": "Takedown",
+        "start": "00:00:11",
+        "end": "00:00:15",
+        "intensity_1_5": 5,
+        "edits": [
+            {"type": "slow_motion", "parameters": {"factor": 0.5}},
+            {"type": "zoom", "parameters": {"start": 1.0, "end": 1.3}},
+            {"type": "sfx", "parameters": {}},
+        ],
+    }]})
+    run_log = {"edits": []}
+
+    count = mod.apply_edits_to_timeline(wrapper, modifier, edits, run_log)
+
+    assert clips[1].speed == 0.5
+    assert clips[1].props == {"ZoomX": 1.3, "ZoomY": 1.3}
+    assert clips[1].color == "Red"
+    assert count == 3
+    (edit_log,) = run_log["edits"]
+    assert edit_log["warnings"] == ["Audio effect 'sfx' requires manual setup on audio track"]
+    (marker,) = markers
+    assert marker[0] == 330 and marker[2] == "Takedown [zoom, speed]"
+    note = marker[3]
+    assert note.startswith("Applied: Zoom: 1.0 -> 1.3; Speed: 50.0%; Color tag: Red\nTODOs:\n- Retime:")
+    assert note.endswith("\nWarnings: Audio effect 'sfx' requires manual setup on audio track")
+
+
+def test_open_editing_guide_feeds_normalize(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+    guide = tmp_path / "match_editing_guide.json"
+    guide.write_text(json.dumps({
+        "project_name": "Match",
+        "video": {"source_path": "/media/match.mp4"},
+        "edits": [{"label": "Pass", "start": "00:01:00", "end": "00:01:04"}],
+    }))
+
+    meta, raw_edits = mod.open_editing_guide(str(guide))
+    edits = mod.normalize_edits(raw_edits)
+
+    assert meta["project_name"] == "Match"
+    assert meta["video"]["source_path"] == "/media/match.mp4"
+    assert [(e["label"], e["start_f"], e["end_f"]) for e in edits] == [("Pass", 1800, 1920)]
+
+
+def test_flush_segments_uses_returned_items_without_rescan(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+    wrapper = make_wrapper(mod, monkeypatch)
+    timeline = wrapper.current_project.timeline
+    timeline.GetItemListInTrack = lambda kind, index: (_ for _ in ()).throw(AssertionError("rescanned"))
+
+    wrapper.queue_segment("media", 0, 30, 1, record_f=0)
+    wrapper.queue_segment("media", 60, 90, 1, record_f=60)
+    segs = wrapper.flush_segments()
+
+    assert [seg.GetStart() for seg in segs] == [0, 60]
+
+
+def test_apply_edits_to_timeline_without_edits_touches_nothing(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+
+    class Untouchable:
+        def __getattr__(self, name):
+            raise AssertionError(f"unexpected Resolve call: {name}")
+
+    assert mod.apply_edits_to_timeline(Untouchable(), Untouchable(), [], {"edits": []}) == 0
+
+
+def test_clip_index_lookups(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+    a, b, c = EditClip("a", 0, 300), EditClip("b", 300, 900), EditClip("c", 1000, 1200)
+    modifier = mod.ClipModifier(resolve_wrapper=None)
+    modifier._build_clip_index([[c, a, b]])
+
+    assert modifier.find_clip_at_frame(0) is a
+    assert modifier.find_clip_at_frame(899) is b
+    assert modifier.find_clip_at_frame(950) is None
+    assert modifier.find_clip_at_frame(-1) is None
+    assert modifier.find_nearest_clip(960, 60) is c
+    assert modifier.find_nearest_clip(650, 60) is None
+
+
+def test_clip_index_prefers_lower_track_on_overlap(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+    v1 = EditClip("v1", 0, 10000)
+    v2 = EditClip("v2", 100, 200)
+    modifier = mod.ClipModifier(resolve_wrapper=None)
+    modifier._build_clip_index([[v1], [v2]])
+
+    assert modifier.find_clip_at_frame(500) is v1
+    assert modifier.find_clip_at_frame(150) is v1
+    assert modifier.find_clip_at_frame(10000) is None
+    assert modifier.find_nearest_clip(110, 60) is v2
+
+
+def test_get_parser_is_built_once(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch, tmp_path)
+
+    parser = mod._get_parser()
+    assert mod._get_parser() is parser
+    args = parser.parse_args(["--json", "guide.json", "--parallel"])
+    assert args.parallel and args.fps == mod.FPS
+
+
+def test_load_editing_guide_reports_missing_and_invalid_files(monkeypatch, tmp_path, capsys):
+    mod = load_module(monkeypatch, tmp_path)
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+
+    assert mod.load_editing_guide(str(tmp_path / "missing.json")) is None
+    assert "JSON file not found" in capsys.readouterr().out
+    assert mod.load_editing_guide(str(bad)) is None
+    assert "Failed to parse JSON" in capsys.readouterr().out
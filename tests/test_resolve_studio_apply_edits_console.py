@@ -0,0 +1,169 @@
+import sys
+import types
+import importlib.util
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "resolve_studio_apply_edits_console.py"
+
+
+def load_module(monkeypatch):
+    # The console script imports the Resolve API at module load; give it a stub
+    monkeypatch.setitem(sys.modules, "DaVinciResolveScript", types.ModuleType("DaVinciResolveScript"))
+    spec = importlib.util.spec_from_file_location("resolve_studio_apply_edits_console", SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class Clip:
+    def __init__(self, name, start, end):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.speed = None
+        self.color = None
+
+    def GetStart(self):
+        return self.start
+
+    def GetEnd(self):
+        return self.end
+
+    def SetSpeed(self, factor):
+        self.speed = factor
+
+    def SetColor(self, color):
+        self.color = color
+
+
+class Timeline:
+    def __init__(self, *tracks):
+        self.tracks = tracks
+
+    def GetTrackCount(self, kind):
+        return len(self.tracks)
+
+    def GetItemListInTrack(self, kind, index):
+        return list(self.tracks[index - 1])
+
+
+class Project:
+    def __init__(self, *tracks):
+        self.timeline = Timeline(*tracks)
+
+    def GetCurrentTimeline(self):
+        return self.timeline
+
+
+def test_apply_edits_to_timeline_matches_containing_clip(monkeypatch):
+    mod = load_module(monkeypatch)
+    late, early = Clip("late", 900, 1800), Clip("early", 0, 900)
+    edits = mod.normalize_edits({"edits": [
+        {"start": "00:00:40", "end": "00:00:45", "intensity_1_5": 4,
+         "edits": [{"type": "slow_motion", "parameters": {"factor": 0.5}}]},
+        {"start": "00:01:30", "end": "00:01:35"},
+    ]})
+
+    count = mod.apply_edits_to_timeline(Project([late, early]), edits)
+
+    assert late.speed == 0.5 and late.color == "Orange"
+    assert early.speed is None and early.color is None
+    assert count == 2
+
+
+def test_parse_timecode_to_seconds(monkeypatch):
+    mod = load_module(monkeypatch)
+
+    assert mod.parse_timecode_to_seconds("01:02:03") == 3723
+    assert mod.parse_timecode_to_seconds("99:59:59") == 359999
+    assert mod.parse_timecode_to_seconds("1:02:03") == 3723
+    assert mod.parse_timecode_to_seconds("0a:02:03") == 0
+    assert mod.parse_timecode_to_seconds("02:03") == 123
+    assert mod.parse_timecode_to_seconds("12.5") == 12.5
+    assert mod.parse_timecode_to_seconds("") == 0
+    assert mod.parse_timecode_to_seconds("bad") == 0
+    assert mod.seconds_to_frames(12.5) == 375
+
+
+def test_match_edits_to_clips(monkeypatch):
+    mod = load_module(monkeypatch)
+    a, b = Clip("a", 0, 300), Clip("b", 600, 900)
+    edits = [{"start_f": f} for f in (-1, 0, 299, 300, 650, 900)]
+
+    assert mod.match_edits_to_clips(edits, [([0, 600], [300, 900], [a, b])]) == [None, a, a, None, b, None]
+
+
+def test_match_edits_to_clips_prefers_lower_track_on_overlap(monkeypatch):
+    mod = load_module(monkeypatch)
+    v1, v2 = Clip("v1", 0, 10000), Clip("v2", 100, 200)
+    tracks = mod.snapshot_clips(Timeline([v1], [v2]))
+    edits = [{"start_f": f} for f in (500, 150, 10000)]
+
+    assert mod.match_edits_to_clips(edits, tracks) == [v1, v1, None]
+
+
+def test_normalize_edits_defaults_and_clamps(monkeypatch):
+    mod = load_module(monkeypatch)
+
+    first, second = mod.normalize_edits({"edits": [
+        {"start": "00:00:10", "end": "00:00:05", "intensity_1_5": 9},
+        {"id": "X1", "label": "Sweep", "start": "00:00:20", "end": "00:00:22", "intensity_1_5": -2},
+    ]})
+
+    assert (first["id"], first["label"], first["intensity"]) == ("E001", "Edit 1", 5)
+    assert (first["start_f"], first["end_f"]) == (300, 330)
+    assert (second["id"], second["label"], second["intensity"]) == ("X1", "Sweep", 1)
+
+
+def test_normalize_edits_accepts_iterable(monkeypatch):
+    mod = load_module(monkeypatch)
+
+    raw = iter([{"start": "00:00:01", "end": "00:00:02"}, {"start": "00:00:03", "end": "00:00:04"}])
+    assert [e["start_f"] for e in mod.normalize_edits(raw)] == [30, 90]
+
+
+def test_merge_edits_by_clip(monkeypatch):
+    mod = load_module(monkeypatch)
+    a, b = Clip("a", 0, 300), Clip("b", 300, 600)
+    slow = {"type": "slow_motion", "parameters": {"factor": 0.5}}
+    zoom = {"type": "zoom", "parameters": {"end_zoom": 1.2}}
+    edits = [
+        {"id": "E1", "label": "One", "intensity": 2, "techniques": [slow]},
+        {"id": "E2", "label": "Two", "intensity": 4, "techniques": [dict(slow), zoom]},
+        {"id": "E3", "label": "Three", "intensity": 1, "techniques": []},
+    ]
+
+    groups = mod.merge_edits_by_clip(edits, [a, b, a])
+
+    assert [clip for clip, _ in groups] == [a, b]
+    merged = groups[0][1]
+    assert (merged["id"], merged["label"], merged["intensity"]) == ("E1+E3", "One / Three", 2)
+    assert merged["techniques"] == [slow]
+    assert groups[1][1]["techniques"] == [slow, zoom]
+    assert edits[0]["techniques"] == [slow]
+
+
+def test_log_is_buffered_until_flush(monkeypatch, capsys):
+    mod = load_module(monkeypatch)
+    for i in range(mod._LOG_FLUSH_EVERY - 1):
+        mod.log(f"line {i}")
+    assert capsys.readouterr().out == ""
+
+    mod.log("last")
+    out = capsys.readouterr().out
+    assert out.count("\n") == mod._LOG_FLUSH_EVERY
+    assert out.endswith("[RESOLVE] last\n")
+
+    mod.log("tail")
+    mod.flush_log()
+    assert capsys.readouterr().out == "[RESOLVE] tail\n"
+
+
+def test_load_editing_guide_reads_bytes(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch)
+    guide = tmp_path / "guide.json"
+    guide.write_bytes(b'{"edits": [{"id": "E1", "start": "00:00:01"}]}')
+    assert mod.load_editing_guide(str(guide))["edits"][0]["id"] == "E1"
+
+    guide.write_bytes(b"{not json")
+    assert mod.load_editing_guide(str(guide)) is None
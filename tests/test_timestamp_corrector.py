@@ -0,0 +1,55 @@
+from utils.timestamp_corrector import parse_time_input
+
+
+def test_parse_time_input_formats():
+    assert parse_time_input("322") == 322.0
+    assert parse_time_input(" 12.5 ") == 12.5
+    assert parse_time_input("5:22") == 322.0
+    assert parse_time_input("05:22") == 322.0
+    assert parse_time_input("0:09:00") == 540.0
+    assert parse_time_input("01:02:03") == 3723.0
+
+
+def test_parse_time_input_rejects_garbage():
+    for bad in ("", "abc", "1:2:3:4", "5:", "-3"):
+        assert parse_time_input(bad) is None
+
+
+def test_save_corrections_backs_up_original_once(tmp_path):
+    import json
+    from utils.timestamp_corrector import save_corrections
+
+    path = tmp_path / "analysis.json"
+    original = b'{"techniques": [{"start_s": 1}]}'
+    path.write_bytes(original)
+
+    backed_up = save_corrections(str(path), {"techniques": [{"start_s": 2}]}, original, False)
+    assert backed_up
+    (tmp_path / "analysis.json.backup").write_bytes(b"sentinel")
+    save_corrections(str(path), {"techniques": [{"start_s": 3}]}, original, backed_up)
+
+    assert (tmp_path / "analysis.json.backup").read_bytes() == b"sentinel"
+    assert json.loads(path.read_text()) == {"techniques": [{"start_s": 3}]}
+
+
+def test_expand_indices():
+    from utils.timestamp_corrector import expand_indices
+
+    assert expand_indices("1,3,5-7") == [1, 3, 5, 6, 7]
+    assert expand_indices("2") == [2]
+
+
+def test_interactive_mode_runs_script(tmp_path):
+    import json
+    from utils.timestamp_corrector import interactive_mode
+
+    path = tmp_path / "analysis.json"
+    path.write_text(json.dumps({"techniques": [{"start_s": 1, "end_s": 2}] * 3}))
+    # ct 0,2: new start/end for index 0, then for index 2 (keep end)
+    script = ["ct 0,2", "0:10", "0:12", "30", "", "s", "q"]
+
+    interactive_mode(str(path), 600.0, script=script)
+
+    techniques = json.loads(path.read_text())["techniques"]
+    assert [(t["start_s"], t["end_s"]) for t in techniques] == [(10, 12), (1, 2), (30, 2)]
+    assert (tmp_path / "analysis.json.backup").exists()
@@ -0,0 +1,105 @@
+from utils import timestamp_validator
+
+
+def test_get_video_duration_caches_per_file_version(monkeypatch, tmp_path):
+    probes = []
+
+    def fake_probe(path):
+        probes.append(path)
+        return 12.5
+
+    monkeypatch.setattr(timestamp_validator, "_probe_duration", fake_probe)
+    timestamp_validator._cached_duration.cache_clear()
+    video = tmp_path / "v.mp4"
+    video.write_bytes(b"x")
+
+    assert timestamp_validator.get_video_duration(str(video)) == 12.5
+    assert timestamp_validator.get_video_duration(str(video)) == 12.5
+    assert len(probes) == 1
+
+    video.write_bytes(b"xy")
+    timestamp_validator.get_video_duration(str(video))
+    assert len(probes) == 2
+    timestamp_validator._cached_duration.cache_clear()
+
+
+def test_get_video_duration_does_not_cache_failures(monkeypatch, tmp_path):
+    def failing_probe(path):
+        raise RuntimeError("no ffprobe")
+
+    monkeypatch.setattr(timestamp_validator, "_probe_duration", failing_probe)
+    timestamp_validator._cached_duration.cache_clear()
+    video = tmp_path / "v.mp4"
+    video.write_bytes(b"x")
+
+    assert timestamp_validator.get_video_duration(str(video)) == 0.0
+    assert timestamp_validator._cached_duration.cache_info().currsize == 0
+
+
+def test_detect_timestamp_clusters():
+    detect = timestamp_validator.detect_timestamp_clusters
+    assert detect([0, 100, 105, 110, 300, 310], min_spacing_s=20) == [(1, 3), (4, 5)]
+    # Unsorted input: indices refer to sorted positions
+    assert detect([110, 0, 105, 100], min_spacing_s=20) == [(1, 3)]
+    assert detect([0, 100, 200]) == []
+    assert detect([5]) == []
+
+
+def test_validate_analysis_timestamps_report():
+    analysis = {
+        "highlight_moments": [
+            {"time_s": 10, "suggested_thumbnail_time_s": 500, "type": "takedown"},
+        ],
+        "momentum_shifts": [{"start_s": 50, "end_s": 40}],
+        "techniques": [{"start_s": -1, "end_s": 20, "name": "armbar"}],
+    }
+    report = timestamp_validator.validate_analysis_timestamps(analysis, 100.0)
+
+    assert report["timestamp_count"] == 6
+    assert report["invalid_count"] == 2
+    assert report["valid"] is False
+    assert report["errors"] == [{
+        "location": "techniques[0].start_s",
+        "timestamp": -1,
+        "name": "armbar",
+        "reason": "Negative timestamp: -1s",
+    }]
+    assert [w["location"] for w in report["warnings"]] == [
+        "highlight_moments[0].suggested_thumbnail_time_s",
+        "momentum_shifts[0]",
+    ]
+
+
+def test_validate_one_writes_report_and_returns_summary(monkeypatch, tmp_path):
+    import json
+
+    monkeypatch.setattr(timestamp_validator, "get_video_duration", lambda path: 100.0)
+    analysis = tmp_path / "m1_analysis.json"
+    analysis.write_text(json.dumps({"techniques": [{"start_s": 1, "end_s": 500}]}))
+    video = tmp_path / "m1.mp4"
+    video.write_bytes(b"")
+
+    assert timestamp_validator.find_video_for_analysis(analysis, tmp_path) == video
+    summary = timestamp_validator._validate_one((str(analysis), str(video), str(tmp_path)))
+
+    assert summary["valid"] is False
+    assert summary["error_count"] == 1
+    report = json.loads((tmp_path / "m1_analysis_validation.json").read_text())
+    assert report["errors"][0]["location"] == "techniques[0].end_s"
+
+
+def test_validate_analysis_timestamps_modes():
+    analysis = {
+        "momentum_shifts": [{"start_s": -1, "end_s": 10}],
+        "techniques": [{"start_s": 500, "end_s": 600}],
+    }
+    validate = timestamp_validator.validate_analysis_timestamps
+
+    summary = validate(analysis, 100.0, mode="summary")
+    assert summary["valid"] is False
+    assert summary["invalid_count"] == 3
+    assert summary["errors"] == [] and summary["warnings"] == []
+
+    fast = validate(analysis, 100.0, mode="fail_fast")
+    assert fast["valid"] is False
+    assert [e["location"] for e in fast["errors"]] == ["momentum_shifts[0].start_s"]
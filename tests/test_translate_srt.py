@@ -0,0 +1,130 @@
+import sys
+import types
+
+import translate_srt
+
+
+SAMPLE = (
+    "1\n"
+    "00:00:01,000 --> 00:00:02,500\n"
+    "Hola\n"
+    "\n"
+    "2\n"
+    "00:00:03,000 --> 00:00:04,000\n"
+    "Dos líneas\n"
+    "de texto\n"
+    "\n"
+)
+
+
+def test_parse_srt_blocks():
+    blocks = translate_srt.parse_srt(SAMPLE)
+    assert blocks[0] == translate_srt.SrtBlock(1, "00:00:01,000", "00:00:02,500", "Hola")
+    assert blocks[1].index == 2
+    assert blocks[1].text == "Dos líneas\nde texto"
+
+
+def test_format_srt_round_trip():
+    blocks = translate_srt.parse_srt(SAMPLE)
+    assert translate_srt.parse_srt(translate_srt.format_srt(blocks)) == blocks
+
+
+def test_parse_srt_tolerates_crlf_bom_and_extra_blank_lines():
+    content = "\ufeff" + SAMPLE.replace("\n\n2", "\n\n\n2").replace("\n", "\r\n")
+    assert translate_srt.parse_srt(content) == translate_srt.parse_srt(SAMPLE)
+
+
+def install_argos_stub(monkeypatch, calls):
+    class Translation:
+        def translate(self, text):
+            calls.append(text)
+            return text.upper()
+
+    class Language:
+        def __init__(self, code):
+            self.code = code
+
+        def get_translation(self, target):
+            return Translation()
+
+    argos = types.ModuleType("argostranslate")
+    argos.settings = types.SimpleNamespace(compute_type="auto")
+    argos.translate = types.SimpleNamespace(
+        get_installed_languages=lambda: [Language("es"), Language("en")]
+    )
+    monkeypatch.setattr(translate_srt, "argostranslate", argos)
+    monkeypatch.setattr(translate_srt, "load_ct2_backend", lambda *a: None)
+    translate_srt._installed_by_code.cache_clear()
+
+
+def test_translate_blocks_translates_each_text_once_and_skips_non_text(monkeypatch):
+    calls = []
+    install_argos_stub(monkeypatch, calls)
+    blocks = [translate_srt.SrtBlock(i, "", "", t)
+              for i, t in enumerate(["hola", "adios", "♪ 123 ♪", "hola"], 1)]
+
+    out = translate_srt.translate_blocks(blocks, "es", "en")
+    translate_srt._installed_by_code.cache_clear()
+
+    assert [b.text for b in out] == ["HOLA", "ADIOS", "♪ 123 ♪", "HOLA"]
+    assert calls == [" ", "hola", "adios"]
+
+
+def test_translate_blocks_reuses_cached_translations(monkeypatch, tmp_path):
+    calls = []
+    install_argos_stub(monkeypatch, calls)
+    cache = translate_srt.open_translation_cache(tmp_path / "cache.sqlite")
+    blocks = [translate_srt.SrtBlock(1, "", "", "hola")]
+
+    first = translate_srt.translate_blocks(blocks, "es", "en", cache=cache)
+    second = translate_srt.translate_blocks(blocks, "es", "en", cache=cache)
+    translate_srt._installed_by_code.cache_clear()
+    cache.close()
+
+    assert first == second
+    assert calls == [" ", "hola"]
+
+
+def test_load_ct2_backend_falls_back_on_unsupported_compute_type(monkeypatch, tmp_path, capsys):
+    (tmp_path / "model").mkdir()
+    (tmp_path / "model" / "model.bin").write_bytes(b"")
+    (tmp_path / "sentencepiece.model").write_bytes(b"")
+
+    def translator(*args, compute_type, **kwargs):
+        raise ValueError(f"requested {compute_type} compute type, but the target device does not support it")
+
+    pkg = types.SimpleNamespace(from_code="es", to_code="en", package_path=str(tmp_path))
+    argos = types.ModuleType("argostranslate")
+    argos.package = types.SimpleNamespace(get_installed_packages=lambda: [pkg])
+    monkeypatch.setattr(translate_srt, "argostranslate", argos)
+    monkeypatch.setitem(sys.modules, "ctranslate2", types.SimpleNamespace(Translator=translator))
+    monkeypatch.setitem(sys.modules, "sentencepiece", types.ModuleType("sentencepiece"))
+
+    assert translate_srt.load_ct2_backend("es", "en", "float16") is None
+    assert "falling back to Argos" in capsys.readouterr().err
+
+
+def test_translate_texts_batched_feeds_shortest_first_and_keeps_order():
+    fed = []
+
+    class Result:
+        def __init__(self, tokens):
+            self.hypotheses = [tokens[::-1]]
+
+    class Translator:
+        def translate_iterable(self, batches, max_batch_size):
+            for tokens in batches:
+                fed.append(tokens)
+                yield Result(tokens)
+
+    class Tokenizer:
+        def encode(self, texts, out_type):
+            return [t.split() for t in texts]
+
+        def decode(self, tokens):
+            return " ".join(tokens)
+
+    out = translate_srt.translate_texts_batched(["a b c", "d", "e f"], Translator(), Tokenizer())
+
+    assert out == ["c b a", "d", "f e"]
+    assert [len(t) for t in fed] == [1, 2, 3]
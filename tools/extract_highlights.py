@@ -8,6 +8,7 @@ import json
 import subprocess
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 HIGHLIGHTS_JSON = "/Users/ppt04/Github/video-analyzer/NocturmexMatch3 4K ULTIMATE/highlights/NocturmexMatch3 4K ULTIMATE_highlights.json"
 SRC = "/Users/ppt04/Movies/NocturmexMatch3 4K ULTIMATE.mp4"
@@ -24,14 +25,17 @@ segs = data.get("highlights") or data.get("segments") or data
 
 print(f"Found {len(segs)} highlight segments")
 
-# Extract each clip
-for idx, seg in enumerate(segs, 1):
+# Extract each clip; -c copy jobs are I/O-bound, so several ffmpeg processes run at once
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+def extract_one(idx, seg):
     start = seg["start_seconds"]
     end = seg["end_seconds"]
     out = os.path.join(CLIPS_DIR, f"clip_{idx:02d}.mp4")
     
     cmd = [
         "ffmpeg",
+        "-nostdin",
         "-hide_banner",
         "-loglevel", "error",
         "-ss", str(start),
@@ -44,11 +48,20 @@ for idx, seg in enumerate(segs, 1):
     ]
     
     print(f"[{idx}/{len(segs)}] Extracting {out}...")
-    try:
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error extracting clip {idx}: {e}", file=sys.stderr)
-        sys.exit(1)
+    subprocess.run(cmd, check=True, stdin=subprocess.DEVNULL)
+    return idx
+
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+    futures = {ex.submit(extract_one, idx, seg): idx for idx, seg in enumerate(segs, 1)}
+    for fut in as_completed(futures):
+        try:
+            fut.result()
+        except subprocess.CalledProcessError as e:
+            print(f"Error extracting clip {futures[fut]}: {e}", file=sys.stderr)
+            # Fail fast: drop queued jobs; running ffmpeg processes finish on their own
+            for other in futures:
+                other.cancel()
+            sys.exit(1)
 
 # Build concat list
 concat_path = os.path.join(WORK_DIR, "concat_list.txt")
@@ -1,5 +1,15 @@
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Set
+
+
+# Directories already created by this process; later calls skip the mkdir syscalls
+_ENSURED_DIRS: Set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
 
 
 def get_output_paths(video_path, output_root: Optional[Path] = None) -> Dict[str, Path]:
@@ -12,9 +22,9 @@ def get_output_paths(video_path, output_root: Optional[Path] = None) -> Dict[str
     editing_dir = match_dir / "editing_guide"
 
     # Ensure directories exist
-    analysis_dir.mkdir(parents=True, exist_ok=True)
-    thumbnails_dir.mkdir(parents=True, exist_ok=True)
-    editing_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(analysis_dir)
+    _ensure_dir(thumbnails_dir)
+    _ensure_dir(editing_dir)
 
     return {
         "root": match_dir,
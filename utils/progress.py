@@ -1,14 +1,19 @@
+import functools
 import sys
 import time
 from typing import Optional
 
 
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def human_bytes(n: int) -> str:
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if n < 1024.0:
-            return f"{n:.0f} {unit}" if unit == 'B' else f"{n:.1f} {unit}"
-        n /= 1024.0
-    return f"{n:.1f} TB"
+    n = int(n)
+    if n < 1024:
+        return f"{n} B"
+    # Each unit is 2**10 of the previous one, so the exponent is bit_length // 10
+    e = min((n.bit_length() - 1) // 10, 4)
+    return f"{n / (1 << (e * 10)):.1f} {_UNITS[e]}"
 
 
 def human_rate(bps: float) -> str:
@@ -16,7 +21,12 @@ def human_rate(bps: float) -> str:
 
 
 def human_duration(sec: float) -> str:
-    sec = max(0, int(round(sec)))
+    return _duration_str(max(0, int(round(sec))))
+
+
+# Progress lines re-render the same elapsed/ETA seconds many times
+@functools.lru_cache(maxsize=4096)
+def _duration_str(sec: int) -> str:
     if sec < 60:
         return f"{sec}s"
     elif sec < 3600:
@@ -46,12 +56,9 @@ class ProgressPrinter:
         if (now - self._last_t) < self.min_interval:
             return
         self._last_t = now
-        if self._is_tty:
-            self.stream.write(f"\r{text}".ljust(80))
-            self.stream.flush()
-        else:
-            self.stream.write(text + "\n")
-            self.stream.flush()
+        # Padded to 80 columns (with the \r) in one format, no intermediate string
+        self.stream.write(f"\r{text:<79}" if self._is_tty else f"{text}\n")
+        self.stream.flush()
 
     def println(self, text: str = ""):
         if self._is_tty and text:
@@ -6,10 +6,26 @@ Allows manual review and correction of timestamps that Gemini got wrong.
 """
 
 import json
+import re
 import sys
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
+
+try:
+    from utils.timestamp_validator import get_video_duration
+except ImportError:  # run directly as utils/timestamp_corrector.py
+    from timestamp_validator import get_video_duration
+
+# Optional fast JSON parser/encoder; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# [[H:]M:]S[.f] - minutes are filled before hours so "5:22" is MM:SS
+_TIME_RE = re.compile(r'^(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d+)?)$')
 
 
 def format_hms(seconds: float) -> str:
@@ -29,29 +45,11 @@ def parse_time_input(time_str: str) -> Optional[float]:
     
     Returns seconds or None if invalid.
     """
-    time_str = time_str.strip()
-    
-    # Try parsing as pure seconds first
-    try:
-        return float(time_str)
-    except ValueError:
-        pass
-    
-    # Try parsing as time format
-    parts = time_str.split(":")
-    try:
-        parts = [int(p) for p in parts]
-    except ValueError:
+    m = _TIME_RE.match(time_str.strip())
+    if not m:
         return None
-    
-    if len(parts) == 3:  # HH:MM:SS
-        h, m, s = parts
-        return float(h * 3600 + m * 60 + s)
-    elif len(parts) == 2:  # MM:SS
-        m, s = parts
-        return float(m * 60 + s)
-    
-    return None
+    h, mi, sec = m.groups()
+    return int(h or 0) * 3600 + int(mi or 0) * 60 + float(sec)
 
 
 def show_highlight_moments(data: Dict, video_duration: float):
@@ -128,7 +126,8 @@ def show_momentum_shifts(data: Dict, video_duration: float):
         print()
 
 
-def correct_highlight_moment(data: Dict, idx: int, video_duration: float) -> bool:
+def correct_highlight_moment(data: Dict, idx: int, video_duration: float,
+                             ask: Callable[[str], str] = input) -> bool:
     """Interactively correct a highlight moment timestamp."""
     if "highlight_moments" not in data or idx >= len(data["highlight_moments"]):
         print(f"Invalid highlight moment index: {idx}")
@@ -147,7 +146,7 @@ def correct_highlight_moment(data: Dict, idx: int, video_duration: float) -> boo
     # Correct main timestamp
     print(f"\nEnter new time (or press Enter to keep {current_time}s):")
     print("Format: seconds (e.g., 540) or MM:SS (e.g., 9:00) or HH:MM:SS")
-    new_time_input = input("> ").strip()
+    new_time_input = ask("> ").strip()
     
     if new_time_input:
         new_time = parse_time_input(new_time_input)
@@ -156,7 +155,7 @@ def correct_highlight_moment(data: Dict, idx: int, video_duration: float) -> boo
             return False
         if new_time < 0 or new_time > video_duration + 5:
             print(f"Warning: Time {new_time}s is outside video duration {video_duration}s")
-            confirm = input("Continue anyway? (y/n): ").strip().lower()
+            confirm = ask("Continue anyway? (y/n): ").strip().lower()
             if confirm != 'y':
                 return False
         moment["time_s"] = int(new_time)
@@ -164,7 +163,7 @@ def correct_highlight_moment(data: Dict, idx: int, video_duration: float) -> boo
     
     # Correct thumbnail timestamp
     print(f"\nEnter new thumbnail time (or press Enter to keep {current_thumb}s):")
-    new_thumb_input = input("> ").strip()
+    new_thumb_input = ask("> ").strip()
     
     if new_thumb_input:
         new_thumb = parse_time_input(new_thumb_input)
@@ -179,7 +178,8 @@ def correct_highlight_moment(data: Dict, idx: int, video_duration: float) -> boo
     return True
 
 
-def correct_technique(data: Dict, idx: int, video_duration: float) -> bool:
+def correct_technique(data: Dict, idx: int, video_duration: float,
+                      ask: Callable[[str], str] = input) -> bool:
     """Interactively correct a technique timestamp."""
     if "techniques" not in data or idx >= len(data["techniques"]):
         print(f"Invalid technique index: {idx}")
@@ -196,7 +196,7 @@ def correct_technique(data: Dict, idx: int, video_duration: float) -> bool:
     
     # Correct start timestamp
     print(f"\nEnter new start time (or press Enter to keep {current_start}s):")
-    new_start_input = input("> ").strip()
+    new_start_input = ask("> ").strip()
     
     if new_start_input:
         new_start = parse_time_input(new_start_input)
@@ -210,7 +210,7 @@ def correct_technique(data: Dict, idx: int, video_duration: float) -> bool:
     
     # Correct end timestamp
     print(f"\nEnter new end time (or press Enter to keep {current_end}s):")
-    new_end_input = input("> ").strip()
+    new_end_input = ask("> ").strip()
     
     if new_end_input:
         new_end = parse_time_input(new_end_input)
@@ -225,7 +225,8 @@ def correct_technique(data: Dict, idx: int, video_duration: float) -> bool:
     return True
 
 
-def correct_momentum_shift(data: Dict, idx: int, video_duration: float) -> bool:
+def correct_momentum_shift(data: Dict, idx: int, video_duration: float,
+                           ask: Callable[[str], str] = input) -> bool:
     """Interactively correct a momentum shift timestamp."""
     if "momentum_shifts" not in data or idx >= len(data["momentum_shifts"]):
         print(f"Invalid momentum shift index: {idx}")
@@ -243,7 +244,7 @@ def correct_momentum_shift(data: Dict, idx: int, video_duration: float) -> bool:
     
     # Correct start timestamp
     print(f"\nEnter new start time (or press Enter to keep {current_start}s):")
-    new_start_input = input("> ").strip()
+    new_start_input = ask("> ").strip()
     
     if new_start_input:
         new_start = parse_time_input(new_start_input)
@@ -257,7 +258,7 @@ def correct_momentum_shift(data: Dict, idx: int, video_duration: float) -> bool:
     
     # Correct end timestamp
     print(f"\nEnter new end time (or press Enter to keep {current_end}s):")
-    new_end_input = input("> ").strip()
+    new_end_input = ask("> ").strip()
     
     if new_end_input:
         new_end = parse_time_input(new_end_input)
@@ -272,30 +273,95 @@ def correct_momentum_shift(data: Dict, idx: int, video_duration: float) -> bool:
     return True
 
 
-def interactive_mode(json_path: str, video_duration: float):
-    """Run interactive correction mode."""
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+def _dump_json(data: Dict, path: str):
+    """Write data as indented JSON (orjson when installed)."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def save_corrections(json_path: str, data: Dict, original: bytes, backed_up: bool) -> bool:
+    """
+    Save corrected data to json_path. The first save of a session also writes
+    the original file contents to <json_path>.backup; later saves skip it.
+    
+    Returns True once the backup exists (pass it back in as backed_up).
+    """
+    if not backed_up:
+        backup_path = json_path + ".backup"
+        with open(backup_path, 'wb') as f:
+            f.write(original)
+        print(f"✓ Backup saved to: {backup_path}")
+    _dump_json(data, json_path)
+    return True
+
+
+def expand_indices(spec: str) -> List[int]:
+    """Expand an index spec like "1,3,5-7" into [1, 3, 5, 6, 7]."""
+    out = []
+    for tok in spec.replace(" ", "").split(","):
+        if "-" in tok:
+            a, b = map(int, tok.split("-"))
+            out.extend(range(a, b + 1))
+        else:
+            out.append(int(tok))
+    return out
+
+
+# Correction commands: name -> corrector(data, idx, video_duration, ask)
+CORRECTORS = {
+    "ch": correct_highlight_moment,
+    "ct": correct_technique,
+    "cm": correct_momentum_shift,
+}
+
+
+def interactive_mode(json_path: str, video_duration: float, script: Optional[Iterable[str]] = None):
+    """
+    Run interactive correction mode.
+    
+    With script (an iterable of lines, e.g. an open file), commands and answers
+    are read from it instead of the keyboard and the menu is not printed; the
+    session quits when the script runs out.
+    """
+    if script is None:
+        ask = input
+    else:
+        lines = iter(script)
+        
+        def ask(prompt: str) -> str:
+            line = next(lines, "q").rstrip("\n")
+            print(f"{prompt}{line}")
+            return line
+    
+    # Keep the file's original bytes for the backup instead of re-serializing
+    original_data = Path(json_path).read_bytes()
+    data = orjson.loads(original_data) if orjson is not None else json.loads(original_data)
     
-    original_data = json.dumps(data, indent=2)
     modified = False
+    backed_up = False
     
     while True:
-        print("\n" + "="*70)
-        print("TIMESTAMP CORRECTOR - Interactive Mode")
-        print("="*70)
-        print("Commands:")
-        print("  h  - Show highlight moments")
-        print("  t  - Show techniques")
-        print("  m  - Show momentum shifts")
-        print("  ch <index> - Correct highlight moment")
-        print("  ct <index> - Correct technique")
-        print("  cm <index> - Correct momentum shift")
-        print("  s  - Save changes")
-        print("  q  - Quit (prompts to save if modified)")
-        print()
+        if script is None:
+            print("\n" + "="*70)
+            print("TIMESTAMP CORRECTOR - Interactive Mode")
+            print("="*70)
+            print("Commands:")
+            print("  h  - Show highlight moments")
+            print("  t  - Show techniques")
+            print("  m  - Show momentum shifts")
+            print("  ch <indices> - Correct highlight moments (e.g. ch 1,3,5-7)")
+            print("  ct <indices> - Correct techniques")
+            print("  cm <indices> - Correct momentum shifts")
+            print("  s  - Save changes")
+            print("  q  - Quit (prompts to save if modified)")
+            print()
         
-        cmd = input("> ").strip().lower()
+        cmd = ask("> ").strip().lower()
+        name, _, spec = cmd.partition(" ")
         
         if cmd == 'h':
             show_highlight_moments(data, video_duration)
@@ -303,51 +369,27 @@ def interactive_mode(json_path: str, video_duration: float):
             show_techniques(data, video_duration)
         elif cmd == 'm':
             show_momentum_shifts(data, video_duration)
-        elif cmd.startswith('ch '):
-            try:
-                idx = int(cmd.split()[1])
-                if correct_highlight_moment(data, idx, video_duration):
-                    modified = True
-            except (ValueError, IndexError):
-                print("Usage: ch <index>")
-        elif cmd.startswith('ct '):
+        elif name in CORRECTORS:
             try:
-                idx = int(cmd.split()[1])
-                if correct_technique(data, idx, video_duration):
+                indices = expand_indices(spec)
+            except ValueError:
+                print(f"Usage: {name} <index>[,<index>|,<first>-<last>...]")
+                continue
+            for idx in indices:
+                if CORRECTORS[name](data, idx, video_duration, ask):
                     modified = True
-            except (ValueError, IndexError):
-                print("Usage: ct <index>")
-        elif cmd.startswith('cm '):
-            try:
-                idx = int(cmd.split()[1])
-                if correct_momentum_shift(data, idx, video_duration):
-                    modified = True
-            except (ValueError, IndexError):
-                print("Usage: cm <index>")
         elif cmd == 's':
             if modified:
-                # Backup original
-                backup_path = json_path + ".backup"
-                with open(backup_path, 'w') as f:
-                    f.write(original_data)
-                print(f"✓ Backup saved to: {backup_path}")
-                
-                # Save corrected
-                with open(json_path, 'w') as f:
-                    json.dump(data, f, indent=2)
+                backed_up = save_corrections(json_path, data, original_data, backed_up)
                 print(f"✓ Saved corrections to: {json_path}")
                 modified = False
             else:
                 print("No modifications to save.")
         elif cmd == 'q':
             if modified:
-                save = input("You have unsaved changes. Save before quitting? (y/n): ").strip().lower()
+                save = ask("You have unsaved changes. Save before quitting? (y/n): ").strip().lower()
                 if save == 'y':
-                    backup_path = json_path + ".backup"
-                    with open(backup_path, 'w') as f:
-                        f.write(original_data)
-                    with open(json_path, 'w') as f:
-                        json.dump(data, f, indent=2)
+                    save_corrections(json_path, data, original_data, backed_up)
                     print(f"✓ Saved to: {json_path}")
             print("Goodbye!")
             break
@@ -371,25 +413,18 @@ def main():
         "--video-file",
         help="Path to source video file (for auto-detecting duration)"
     )
+    parser.add_argument(
+        "--script",
+        help="Read commands and answers from this file, one per line, instead of prompting"
+    )
     
     args = parser.parse_args()
     
     # Determine video duration
     duration = args.video_duration
     if not duration and args.video_file:
-        # Try to auto-detect
-        try:
-            import subprocess
-            res = subprocess.run([
-                "ffprobe", "-v", "error",
-                "-select_streams", "v:0",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                args.video_file
-            ], capture_output=True, text=True, check=True)
-            duration = float(res.stdout.strip())
-        except Exception as e:
-            print(f"Warning: Could not auto-detect video duration: {e}")
+        # Try to auto-detect (warns and returns 0 on failure)
+        duration = get_video_duration(args.video_file)
     
     if not duration:
         print("Error: Video duration required. Use --video-duration or --video-file")
@@ -399,7 +434,11 @@ def main():
         print(f"Error: JSON file not found: {args.json_file}")
         return 1
     
-    interactive_mode(args.json_file, duration)
+    if args.script:
+        with open(args.script) as f:
+            interactive_mode(args.json_file, duration, script=f)
+    else:
+        interactive_mode(args.json_file, duration)
     return 0
 
 
@@ -6,30 +6,77 @@ Gemini's video analysis sometimes produces inaccurate timestamps. This module
 provides tools to validate, flag, and optionally correct suspicious timestamps.
 """
 
+import functools
 import json
+import os
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, List, Literal, Tuple, Optional
+
+# Optional fast JSON parser; stdlib json is the fallback
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Optional PyAV: reads the container header in-process instead of spawning ffprobe
+try:
+    import av
+except ImportError:
+    av = None
+
+# Slack allowed past the end of the video before a timestamp is out of range
+DEFAULT_MARGIN_S = 5.0
+
+
+def _probe_duration(video_path: str) -> float:
+    """Read duration with PyAV if installed, else ffprobe. Raises on failure."""
+    if av is not None:
+        try:
+            with av.open(video_path) as container:
+                if container.duration is not None:
+                    return float(container.duration) / av.time_base
+        except Exception:
+            pass  # fall back to ffprobe
+    res = subprocess.run([
+        "ffprobe", "-hide_banner", "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        video_path
+    ], stdin=subprocess.DEVNULL, capture_output=True, check=True)
+    # float() accepts bytes and ignores surrounding whitespace; no decode needed
+    return float(res.stdout)
+
+
+# Keyed by (path, mtime_ns, size) so a re-encoded file is probed again.
+# Failures raise and are therefore never cached.
+@functools.lru_cache(maxsize=256)
+def _cached_duration(abs_path: str, mtime_ns: int, size: int) -> float:
+    return _probe_duration(abs_path)
 
 
 def get_video_duration(video_path: str) -> float:
-    """Get video duration in seconds using ffprobe."""
+    """Get video duration in seconds using PyAV if installed, else ffprobe.
+    
+    Results are cached per file version; returns 0.0 (with a warning) on failure.
+    """
     try:
-        res = subprocess.run([
-            "ffprobe", "-v", "error",
-            "-select_streams", "v:0",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            video_path
-        ], capture_output=True, text=True, check=True)
-        return float(res.stdout.strip())
+        try:
+            st = os.stat(video_path)
+        except OSError:
+            return _probe_duration(video_path)
+        return _cached_duration(os.path.abspath(video_path), st.st_mtime_ns, st.st_size)
     except Exception as e:
         print(f"Warning: Could not determine video duration: {e}")
         return 0.0
 
 
 def validate_timestamp_range(timestamp_s: float, duration_s: float, 
-                             margin_s: float = 5.0) -> Tuple[bool, str]:
+                             margin_s: float = DEFAULT_MARGIN_S) -> Tuple[bool, str]:
     """
     Validate that a timestamp falls within video duration.
     
@@ -49,26 +96,29 @@ def detect_timestamp_clusters(timestamps: List[float],
     Detect suspicious clustering of timestamps.
     
     Returns:
-        List of (start_index, end_index) for clusters that are too close together
+        List of (start_index, end_index) for clusters that are too close together;
+        indices are positions in the timestamps sorted ascending
     """
     if len(timestamps) < 2:
         return []
     
-    sorted_ts = sorted(enumerate(timestamps), key=lambda x: x[1])
+    # Indices are positions in sorted order, so only the values need sorting.
+    # Gemini usually emits them chronologically; an O(n) check skips the copy + sort.
+    if all(a <= b for a, b in zip(timestamps, islice(timestamps, 1, None))):
+        sorted_ts = timestamps
+    else:
+        sorted_ts = sorted(timestamps)
     clusters = []
-    cluster_start = 0
+    cluster_start = -1
     
-    for i in range(1, len(sorted_ts)):
-        prev_idx, prev_t = sorted_ts[i-1]
-        curr_idx, curr_t = sorted_ts[i]
-        
+    # One pass over adjacent gaps; a run of short gaps is one cluster
+    for i, (prev_t, curr_t) in enumerate(zip(sorted_ts, islice(sorted_ts, 1, None)), 1):
         if curr_t - prev_t < min_spacing_s:
             if cluster_start == -1:
                 cluster_start = i - 1
-        else:
-            if cluster_start != -1:
-                clusters.append((cluster_start, i - 1))
-                cluster_start = -1
+        elif cluster_start != -1:
+            clusters.append((cluster_start, i - 1))
+            cluster_start = -1
     
     if cluster_start != -1:
         clusters.append((cluster_start, len(sorted_ts) - 1))
@@ -76,128 +126,113 @@ def detect_timestamp_clusters(timestamps: List[float],
     return clusters
 
 
-def validate_analysis_timestamps(analysis_json: Dict, video_duration_s: float) -> Dict:
+# Timestamp fields checked per collection, in report order:
+#   (collection, ((field, is_error, extra_key), ...), cluster_field, check_start_before_end)
+# is_error=False reports the field as a warning; extra_key names an item field
+# copied into the entry; cluster_field's values are checked for clustering.
+_TIMESTAMP_FIELDS = (
+    ("highlight_moments",
+     (("time_s", True, "type"), ("suggested_thumbnail_time_s", False, None)),
+     "time_s", False),
+    ("momentum_shifts",
+     (("start_s", True, None), ("end_s", True, None)),
+     None, True),
+    ("techniques",
+     (("start_s", True, "name"), ("end_s", True, "name")),
+     None, False),
+)
+
+
+def validate_analysis_timestamps(analysis_json: Dict, video_duration_s: float,
+                                 mode: Literal["full", "summary", "fail_fast"] = "full") -> Dict:
     """
     Validate all timestamps in Gemini analysis JSON.
     
+    mode:
+        "full"      - every error and warning entry (default)
+        "summary"   - only valid/timestamp_count/invalid_count; lists stay empty
+        "fail_fast" - stop at the first error (for yes/no CI checks)
+    
     Returns:
         Validation report with warnings and errors
     """
-    report = {
-        "valid": True,
-        "warnings": [],
-        "errors": [],
-        "timestamp_count": 0,
-        "invalid_count": 0
-    }
+    errors = []
+    warnings = []
+    timestamp_count = 0
+    invalid_count = 0
+    error_count = 0
+    detailed = mode != "summary"
+    limit = video_duration_s + DEFAULT_MARGIN_S
     
-    # Check highlight_moments
-    if "highlight_moments" in analysis_json:
-        timestamps = []
-        for idx, moment in enumerate(analysis_json["highlight_moments"]):
-            time_s = moment.get("time_s")
-            suggested_s = moment.get("suggested_thumbnail_time_s")
-            
-            if time_s is not None:
-                timestamps.append(time_s)
-                report["timestamp_count"] += 1
-                is_valid, reason = validate_timestamp_range(time_s, video_duration_s)
-                if not is_valid:
-                    report["invalid_count"] += 1
-                    report["valid"] = False
-                    report["errors"].append({
-                        "location": f"highlight_moments[{idx}].time_s",
-                        "timestamp": time_s,
-                        "type": moment.get("type"),
-                        "reason": reason
-                    })
+    # One table-driven pass; counters stay in locals until the report is built
+    for collection, fields, cluster_field, check_order in _TIMESTAMP_FIELDS:
+        if collection not in analysis_json:
+            continue
+        cluster_ts = []
+        
+        for idx, item in enumerate(analysis_json[collection]):
+            for field, is_error, extra_key in fields:
+                ts = item.get(field)
+                if ts is None:
+                    continue
+                timestamp_count += 1
+                if field == cluster_field:
+                    cluster_ts.append(ts)
+                # In-range fast path: one chained comparison, no tuple or reason string
+                if 0 <= ts <= limit:
+                    continue
+                is_valid, reason = validate_timestamp_range(ts, video_duration_s)
+                if is_valid:
+                    continue
+                invalid_count += 1
+                if is_error:
+                    error_count += 1
+                if not detailed:
+                    continue
+                # Location/extra lookups happen only here, for the rare invalid value
+                entry = {"location": f"{collection}[{idx}].{field}", "timestamp": ts}
+                if extra_key:
+                    entry[extra_key] = item.get(extra_key)
+                entry["reason"] = reason
+                if is_error:
+                    errors.append(entry)
+                    if mode == "fail_fast":
+                        return {
+                            "valid": False,
+                            "warnings": warnings,
+                            "errors": errors,
+                            "timestamp_count": timestamp_count,
+                            "invalid_count": invalid_count
+                        }
+                else:
+                    warnings.append(entry)
             
-            if suggested_s is not None:
-                report["timestamp_count"] += 1
-                is_valid, reason = validate_timestamp_range(suggested_s, video_duration_s)
-                if not is_valid:
-                    report["invalid_count"] += 1
-                    report["warnings"].append({
-                        "location": f"highlight_moments[{idx}].suggested_thumbnail_time_s",
-                        "timestamp": suggested_s,
-                        "reason": reason
+            if check_order and detailed:
+                start_s = item.get("start_s")
+                end_s = item.get("end_s")
+                if start_s is not None and end_s is not None and start_s >= end_s:
+                    warnings.append({
+                        "location": f"{collection}[{idx}]",
+                        "message": f"Start time {start_s}s >= end time {end_s}s"
                     })
         
         # Check for suspicious clustering
-        if len(timestamps) >= 3:
-            clusters = detect_timestamp_clusters(timestamps, min_spacing_s=20.0)
+        if detailed and len(cluster_ts) >= 3:
+            clusters = detect_timestamp_clusters(cluster_ts, min_spacing_s=20.0)
             if clusters:
-                report["warnings"].append({
+                warnings.append({
                     "type": "clustering",
                     "message": f"Found {len(clusters)} timestamp clusters with <20s spacing",
                     "clusters": clusters
                 })
     
-    # Check momentum_shifts
-    if "momentum_shifts" in analysis_json:
-        for idx, shift in enumerate(analysis_json["momentum_shifts"]):
-            start_s = shift.get("start_s")
-            end_s = shift.get("end_s")
-            
-            if start_s is not None:
-                report["timestamp_count"] += 1
-                is_valid, reason = validate_timestamp_range(start_s, video_duration_s)
-                if not is_valid:
-                    report["invalid_count"] += 1
-                    report["errors"].append({
-                        "location": f"momentum_shifts[{idx}].start_s",
-                        "timestamp": start_s,
-                        "reason": reason
-                    })
-            
-            if end_s is not None:
-                report["timestamp_count"] += 1
-                is_valid, reason = validate_timestamp_range(end_s, video_duration_s)
-                if not is_valid:
-                    report["invalid_count"] += 1
-                    report["errors"].append({
-                        "location": f"momentum_shifts[{idx}].end_s",
-                        "timestamp": end_s,
-                        "reason": reason
-                    })
-            
-            if start_s is not None and end_s is not None and start_s >= end_s:
-                report["warnings"].append({
-                    "location": f"momentum_shifts[{idx}]",
-                    "message": f"Start time {start_s}s >= end time {end_s}s"
-                })
-    
-    # Check techniques
-    if "techniques" in analysis_json:
-        for idx, tech in enumerate(analysis_json["techniques"]):
-            start_s = tech.get("start_s")
-            end_s = tech.get("end_s")
-            
-            if start_s is not None:
-                report["timestamp_count"] += 1
-                is_valid, reason = validate_timestamp_range(start_s, video_duration_s)
-                if not is_valid:
-                    report["invalid_count"] += 1
-                    report["errors"].append({
-                        "location": f"techniques[{idx}].start_s",
-                        "timestamp": start_s,
-                        "name": tech.get("name"),
-                        "reason": reason
-                    })
-            
-            if end_s is not None:
-                report["timestamp_count"] += 1
-                is_valid, reason = validate_timestamp_range(end_s, video_duration_s)
-                if not is_valid:
-                    report["invalid_count"] += 1
-                    report["errors"].append({
-                        "location": f"techniques[{idx}].end_s",
-                        "timestamp": end_s,
-                        "name": tech.get("name"),
-                        "reason": reason
-                    })
-    
-    return report
+    return {
+        "valid": error_count == 0,
+        "warnings": warnings,
+        "errors": errors,
+        "timestamp_count": timestamp_count,
+        "invalid_count": invalid_count
+    }
 
 
 def print_validation_report(report: Dict):
@@ -235,9 +270,131 @@ def print_validation_report(report: Dict):
     print("="*60 + "\n")
 
 
-def main():
-    """CLI for validating analysis JSON timestamps."""
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".mkv", ".m4v", ".avi", ".webm")
+
+
+def _validate_one(job: Tuple[str, str, Optional[str]]) -> Dict:
+    """
+    Batch worker: validate one (json_path, video_path, export_dir) job.
+    
+    The full report is written to export_dir by the worker; only a small
+    summary is sent back to the parent process.
+    """
+    json_path, video_path, export_dir = job
+    summary = {"json": json_path, "video": video_path, "valid": False, "error": None}
+    try:
+        analysis = _loads(Path(json_path).read_bytes())
+    except (OSError, ValueError) as e:
+        summary["error"] = f"Could not load JSON: {e}"
+        return summary
+    duration = get_video_duration(video_path)
+    if duration == 0:
+        summary["error"] = "Could not determine video duration"
+        return summary
+    
+    report = validate_analysis_timestamps(analysis, duration)
+    if export_dir:
+        out = Path(export_dir) / f"{Path(json_path).stem}_validation.json"
+        with open(out, 'w') as f:
+            json.dump(report, f, indent=2)
+    summary.update(
+        valid=report["valid"],
+        timestamp_count=report["timestamp_count"],
+        invalid_count=report["invalid_count"],
+        error_count=len(report["errors"]),
+        warning_count=len(report["warnings"]),
+    )
+    return summary
+
+
+def validate_batch(pairs: List[Tuple[str, str]], export_dir: Optional[str] = None,
+                   max_workers: Optional[int] = None) -> List[Dict]:
+    """
+    Validate many (json_path, video_path) pairs across processes.
+    
+    Returns one summary dict per pair, in input order (see _validate_one).
+    """
+    if not pairs:
+        return []
+    workers = max_workers or os.cpu_count() or 1
+    jobs = [(json_path, video_path, export_dir) for json_path, video_path in pairs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_validate_one, jobs, chunksize=max(1, len(jobs) // (4 * workers))))
+
+
+def find_video_for_analysis(json_path: Path, video_dir: Path) -> Optional[Path]:
+    """Find <stem>.<ext> in video_dir for <stem>_analysis.json (or <stem>.json)."""
+    stem = json_path.name
+    for suffix in ("_analysis.json", ".json"):
+        if stem.endswith(suffix):
+            stem = stem[:-len(suffix)]
+            break
+    for ext in VIDEO_EXTENSIONS:
+        candidate = video_dir / f"{stem}{ext}"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def main_batch(argv: Optional[List[str]] = None) -> int:
+    """CLI for validating many analysis JSON files in parallel."""
     import argparse
+    import glob
+    
+    parser = argparse.ArgumentParser(
+        prog="timestamp_validator.py batch",
+        description="Validate timestamps in many Gemini analysis JSON files in parallel"
+    )
+    parser.add_argument("json_glob", help='Glob of analysis JSON files, e.g. "out/*/analysis/*_analysis.json"')
+    parser.add_argument("--video-dir", required=True,
+                        help="Directory holding the source videos, named <stem>.<ext>")
+    parser.add_argument("--export-dir", help="Write one <json stem>_validation.json report per file here")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    
+    args = parser.parse_args(argv)
+    
+    json_paths = sorted(glob.glob(args.json_glob, recursive=True))
+    if not json_paths:
+        print(f"Error: No JSON files match: {args.json_glob}")
+        return 1
+    
+    pairs = []
+    for json_path in json_paths:
+        video = find_video_for_analysis(Path(json_path), Path(args.video_dir))
+        if video is None:
+            print(f"  ⚠ {json_path}: no matching video in {args.video_dir}, skipping")
+            continue
+        pairs.append((json_path, str(video)))
+    
+    if args.export_dir:
+        Path(args.export_dir).mkdir(parents=True, exist_ok=True)
+    
+    results = validate_batch(pairs, args.export_dir, args.workers)
+    
+    for res in results:
+        if res["error"]:
+            print(f"  ✗ {res['json']}: {res['error']}")
+        else:
+            mark = "✓" if res["valid"] else "✗"
+            print(f"  {mark} {res['json']}: {res['invalid_count']}/{res['timestamp_count']} invalid, "
+                  f"{res['error_count']} errors, {res['warning_count']} warnings")
+    
+    n_valid = sum(1 for res in results if res["valid"])
+    print(f"\n{n_valid}/{len(results)} analyses valid")
+    return 0 if results and n_valid == len(results) else 1
+
+
+def main(argv: Optional[List[str]] = None):
+    """CLI for validating analysis JSON timestamps.
+    
+    "timestamp_validator.py batch ..." runs main_batch instead.
+    """
+    import argparse
+    import sys
+    
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["batch"]:
+        return main_batch(argv[1:])
     
     parser = argparse.ArgumentParser(
         description="Validate timestamps in Gemini video analysis JSON"
@@ -248,12 +405,16 @@ def main():
         "--export-report",
         help="Export validation report to JSON file"
     )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--summary", action="store_true",
+                      help="Only count timestamps and invalid ones; skip per-entry details")
+    mode.add_argument("--fail-fast", action="store_true",
+                      help="Stop at the first error (exit status only matters)")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Load analysis
-    with open(args.json_file, 'r') as f:
-        analysis = json.load(f)
+    analysis = _loads(Path(args.json_file).read_bytes())
     
     # Get video duration
     duration = get_video_duration(args.video_file)
@@ -264,7 +425,8 @@ def main():
     print(f"Video duration: {duration:.1f}s ({duration/60:.1f}m)")
     
     # Validate
-    report = validate_analysis_timestamps(analysis, duration)
+    mode = "summary" if args.summary else "fail_fast" if args.fail_fast else "full"
+    report = validate_analysis_timestamps(analysis, duration, mode)
     
     # Print report
     print_validation_report(report)